@@ -1,17 +1,20 @@
-﻿import copy
+﻿import hashlib
 import json
 import math
 import os
 import sys
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from io import BytesIO
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, Tuple
 
-from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
-from PySide6.QtCore import QBuffer, QIODevice, QObject, QPointF, Qt, Signal, QTimer
-from PySide6.QtGui import QColor, QFontMetrics, QIcon, QPainter, QPen, QPixmap
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PySide6.QtCore import QObject, QPointF, QRunnable, Qt, QThreadPool, Signal, QTimer
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QIcon, QImage, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -42,11 +45,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-CHARACTER_LAYERS = ["character", "character2", "character3", "character4"]
+CHARACTER_LAYERS = ("character", "character2", "character3", "character4")
 EXTRA_CHARACTER_LAYERS = CHARACTER_LAYERS[1:]
-RENDER_LAYER_ORDER = ["background", *CHARACTER_LAYERS, "gradient", "logo"]
-CONTROL_LAYER_ORDER = [*CHARACTER_LAYERS, "background", "logo"]
-LAYER_ORDER = ["background", *CHARACTER_LAYERS, "gradient", "logo", "fx"]
+RENDER_LAYER_ORDER = ("background", *CHARACTER_LAYERS, "gradient", "logo")
+CONTROL_LAYER_ORDER = (*CHARACTER_LAYERS, "background", "logo")
+LAYER_ORDER = ("background", *CHARACTER_LAYERS, "gradient", "logo", "fx")
+POSTER_AUTO_PLACE_LAYERS = (*CHARACTER_LAYERS, "logo")
 
 GUIDE_COLOR_MAP = {
     "background": (254, 67, 218),
@@ -114,25 +118,226 @@ PRESETS = {
     },
 }
 
-TRANSPARENCY_VALIDATE_PRESETS = [
+LOGO_FONT_CANDIDATES = (
+    "Montserrat-Bold.ttf",
+    "/usr/share/fonts/truetype/montserrat/Montserrat-Bold.ttf",
+    "/Library/Fonts/Montserrat-Bold.ttf",
+    "C:/Windows/Fonts/montserrat-bold.ttf",
+)
+POSTER_TEXTBOX_FONT_CANDIDATES = (
+    "Montserrat-Bold.ttf",
+    "Arialbd.ttf",
+    "/usr/share/fonts/truetype/montserrat/Montserrat-Bold.ttf",
+    "/Library/Fonts/Montserrat-Bold.ttf",
+    "C:/Windows/Fonts/montserrat-bold.ttf",
+    "C:/Windows/Fonts/arialbd.ttf",
+)
+
+PRESET_IDS = tuple(PRESETS)
+PRESET_SIZES: Dict[str, Tuple[int, int]] = {preset_id: meta["size"] for preset_id, meta in PRESETS.items()}
+SKIP_LOGO_PRESETS = frozenset(preset_id for preset_id, meta in PRESETS.items() if meta.get("skip_logo"))
+
+SCALED_PIXMAP_CACHE_SIZE = 32
+RESIZED_IMAGE_CACHE_SIZE = 12
+RESIZED_IMAGE_CACHE_MAX_PIXELS = 16_000_000
+MIPMAP_MIN_SIZE = 64
+# Large downscales first go through Image.reduce() so the resampling filter only
+# runs on the final ~3x step; the quality difference is not visible at export size.
+RESIZE_REDUCING_GAP = 3.0
+# Near-1:1 export resizes look the same with bilinear as with LANCZOS, at a fraction of the cost.
+EXPORT_BILINEAR_RATIO_RANGE = (0.85, 1.15)
+SHADOW_DOWNSAMPLE_MIN_BLUR = 8
+SHADOW_DOWNSAMPLE_MAX_FACTOR = 4
+# The shadow angle is a whole number of degrees (spin box and project load both round it).
+SHADOW_ANGLE_VECTORS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in range(360)
+)
+POSTER_TEXTBOX_CACHE_SIZE = 32
+LOGO_RENDER_CACHE_SIZE = 8
+GRADIENT_PREVIEW_CACHE_SIZE = 4
+GRADIENT_IMAGE_CACHE_MAX_PIXELS = 16_000_000
+PRESET_THUMBNAIL_CACHE_SIZE = 48
+PRESET_PREVIEW_STYLE_ACTIVE = "border: 2px solid #D78EF1; background-color: #1F1F24;"
+PRESET_PREVIEW_STYLE_INACTIVE = "border: 2px solid #5E5E66; background-color: #1F1F24;"
+POSITION_LABEL_NAMES = {
+    "background": "Background",
+    "character": "Perso",
+    "character2": "Perso 2",
+    "character3": "Perso 3",
+    "character4": "Perso 4",
+    "logo": "Logo",
+}
+
+TRANSPARENCY_VALIDATE_PRESETS = (
     "background",
     "background_no_logo",
     "poster",
     "fullscreen",
     "hero",
-]
+)
+
+
+def _fit_ratio_cover(canvas_w: int, canvas_h: int, src_w: int, src_h: int) -> float:
+    return max(canvas_w / src_w, canvas_h / src_h)
+
+
+def _fit_ratio_contain(canvas_w: int, canvas_h: int, src_w: int, src_h: int) -> float:
+    return min(canvas_w / src_w, canvas_h / src_h)
+
+
+def _fit_ratio_native(canvas_w: int, canvas_h: int, src_w: int, src_h: int) -> float:
+    return 1.0
+
+
+@lru_cache(maxsize=8)
+def _resolve_font_candidate(candidates: Tuple[str, ...]) -> str | None:
+    # Probe the candidate list once; later sizes open the font that worked directly.
+    for candidate in candidates:
+        try:
+            ImageFont.truetype(candidate, 12)
+        except OSError:
+            continue
+        return candidate
+    return None
+
+
+# Shared by the logo and poster textbox renderers; size spinners and the textbox
+# fitting loop would otherwise reopen the TTF on every step.
+@lru_cache(maxsize=64)
+def _load_truetype_font(candidates: Tuple[str, ...], size: int) -> ImageFont.FreeTypeFont | None:
+    candidate = _resolve_font_candidate(candidates)
+    if candidate is None:
+        return None
+    try:
+        return ImageFont.truetype(candidate, size)
+    except OSError:
+        return None
+
+
+def _load_montserrat(size: int) -> ImageFont.FreeTypeFont | None:
+    return _load_truetype_font(LOGO_FONT_CANDIDATES, size)
+
+
+# load_default() builds a new font object on every call; one shared instance keeps the
+# fallback from defeating _font_text_bbox, which is keyed on the font object.
+@lru_cache(maxsize=1)
+def _load_default_font():
+    return ImageFont.load_default()
+
+
+# Fonts come from the cached loaders above, so the same object is reused per size and
+# repeated lines (or re-renders after a color/alignment change) skip the shaper.
+@lru_cache(maxsize=256)
+def _font_text_bbox(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=32)
+def _qt_bold_font(point_size: int) -> QFont:
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(point_size)
+    return font
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _qt_font_metrics(family: str, point_size: int, bold: bool) -> QFontMetrics:
+    font = QFont(family)
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return QFontMetrics(font)
+
+
+@lru_cache(maxsize=64)
+def _parse_hex_rgb(hex_color: str, fallback: str) -> Tuple[int, int, int]:
+    color = QColor(hex_color)
+    if not color.isValid():
+        color = QColor(fallback)
+    return color.red(), color.green(), color.blue()
+
+
+@lru_cache(maxsize=16)
+def _guide_match_luts(colors: Tuple[Tuple[int, int, int], ...], tolerance: int):
+    # Color k contributes 4 ** k per band within tolerance, so the sum of the three bands
+    # holds every color's match count in its own base-4 digit (up to four colors per byte).
+    band_lut = []
+    for band in range(3):
+        band_lut.extend(
+            sum(4**index for index, rgb in enumerate(colors) if abs(value - rgb[band]) <= tolerance)
+            for value in range(256)
+        )
+    color_luts = tuple(
+        tuple(255 if (value >> (2 * index)) & 3 == 3 else 0 for value in range(256))
+        for index in range(len(colors))
+    )
+    return tuple(band_lut), color_luts
+
+
+@lru_cache(maxsize=32)
+def _shadow_alpha_lut(alpha: int) -> bytes:
+    return bytes(int((px * alpha) / 255) for px in range(256))
+
+
+@lru_cache(maxsize=128)
+def _opacity_lut(opacity: float) -> bytes:
+    return bytes(int(px * opacity) for px in range(256))
+
+
+FIT_RATIO_FUNCS = {
+    "cover": _fit_ratio_cover,
+    "crop": _fit_ratio_cover,
+    "contain": _fit_ratio_contain,
+}
+
+
+@dataclass(slots=True)
 class LayerAsset:
     path: str = ""
     pixmap: QPixmap | None = None
     pil: Image.Image | None = None
+    mipmaps: list = field(default_factory=list)
+    pil_mipmaps: list = field(default_factory=list)
+    alpha_bbox: Tuple[int, int, int, int] | None = None
 
 
 class SignalEmitter(QObject):
     moved = Signal(str, float, float)
     clicked = Signal(str)
+    released = Signal(str)
+
+
+class RenderTaskSignals(QObject):
+    finished = Signal(int, object, object, str)
+
+
+class BackgroundRenderTask(QRunnable):
+    """Runs a render callable on the thread pool and reports back as (revision, key, result, error).
+
+    A failed render reports a None result with the error text, so callers can clear their
+    pending state and log it on the GUI thread.
+    """
+
+    def __init__(self, render, revision: int, key, source):
+        super().__init__()
+        self.render = render
+        self.revision = revision
+        self.key = key
+        self.source = source
+        self.signal_emitter = RenderTaskSignals()
+        self.finished = self.signal_emitter.finished
+
+    def run(self):
+        try:
+            result = self.render(self.source)
+            error = ""
+        except Exception as exc:
+            result = None
+            error = str(exc) or type(exc).__name__
+        try:
+            self.finished.emit(self.revision, self.key, result, error)
+        except RuntimeError:
+            # The window (and the signal object) went away while this was rendering.
+            pass
 
 
 class LayerGraphicsItem(QGraphicsPixmapItem):
@@ -142,6 +347,7 @@ class LayerGraphicsItem(QGraphicsPixmapItem):
         self.signal_emitter = SignalEmitter()
         self.moved = self.signal_emitter.moved
         self.clicked = self.signal_emitter.clicked
+        self.released = self.signal_emitter.released
         self.setFlag(QGraphicsPixmapItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsPixmapItem.GraphicsItemFlag.ItemSendsScenePositionChanges, True)
         self.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
@@ -156,6 +362,10 @@ class LayerGraphicsItem(QGraphicsPixmapItem):
         self.signal_emitter.clicked.emit(self.layer_id)
         super().mousePressEvent(event)
 
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        self.signal_emitter.released.emit(self.layer_id)
+
 
 class CanvasView(QGraphicsView):
     wheelScaled = Signal(float)
@@ -186,6 +396,8 @@ class PresetPreviewLabel(QLabel):
 
 
 class ARPlusWindow(QMainWindow):
+    log_message = Signal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ARPlus")
@@ -208,7 +420,7 @@ class ARPlusWindow(QMainWindow):
         self.logo_shadow_opacity = 60
         self.logo_shadow_color = "#000000"
         self.gradient_settings = {
-            preset_id: self._default_gradient_config() for preset_id in PRESETS
+            preset_id: self._default_gradient_config() for preset_id in PRESET_IDS
         }
         self.guides_visible = True
         self.guides_opacity = GUIDE_OPACITY_DEFAULT
@@ -221,17 +433,49 @@ class ARPlusWindow(QMainWindow):
         self.presets_preview_quality_scale = 0.65
         self.live_refresh_interval_ms = 70
         self.layer_move_preview_interval_ms = 180
+        self.preview_settle_interval_ms = 160
+        self.position_info_interval_ms = 16
+        self.logo_shadow_interval_ms = 50
+        self.logo_shadow_revision = 0
+        self.logo_shadow_result_revision = 0
+        self.logo_shadow_pending: Tuple[tuple, QImage, tuple] | None = None
+        self.logo_shadow_result: Tuple[tuple, QPixmap] | None = None
+        self.logo_shadow_template: Tuple[tuple, Tuple[Image.Image, int]] | None = None
         self.live_refresh_pending = False
+        self.preview_interacting = False
+        self.preview_items_fast = False
         self.layer_move_refresh_pending = False
         self.current_preset = "poster"
         self.active_layer = "background"
         self.updating_ui = False
         self.program_root = Path(__file__).resolve().parent
         self.autosave_dir = self.program_root / "autosafe"
-        self.guide_pixmaps: Dict[str, QPixmap] = {}
+        self.guide_images: Dict[str, QImage] = {}
+        self.guide_pixmap_cache: Dict[int, QPixmap] = {}
         self.guide_regions: Dict[str, Dict[str, Tuple[float, float, float, float]]] = {}
-        self.preset_preview_dirty: set[str] = set(PRESETS.keys())
-        self.preset_preview_queue: list[str] = []
+        self.guide_load_generation = 0
+        self.guide_loads_pending: set[str] = set()
+        self.guide_decode_cache: Dict[tuple, Tuple[QImage, Dict[str, Tuple[float, float, float, float]]]] = {}
+        self.preset_preview_dirty: set[str] = set(PRESET_IDS)
+        self.preset_preview_queue: OrderedDict[str, int] = OrderedDict()
+        self.preset_preview_jobs: set[str] = set()
+        self.presets_preview_max_jobs = max(1, QThreadPool.globalInstance().maxThreadCount() - 1)
+        self.preset_preview_revisions: Dict[str, int] = {preset_id: 0 for preset_id in PRESET_IDS}
+        self.preset_thumbnail_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self.scaled_pixmap_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self.resized_image_cache: OrderedDict[tuple, Tuple[Image.Image, Image.Image]] = OrderedDict()
+        self.render_cache_lock = threading.Lock()
+        self.last_layer_render_keys: Dict[str, tuple] = {}
+        self.last_overlay_render_key: tuple | None = None
+        self.logo_preview_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self.logo_export_cache: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.poster_textbox_cache: OrderedDict[tuple, Tuple[Image.Image, int, int]] = OrderedDict()
+        self.poster_textbox_pixmap_cache: Tuple[Image.Image, QPixmap] | None = None
+        self.gradient_preview_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self.gradient_image_cache: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self.logo_font_fallback_logged = False
+        self.last_autosave: Tuple[tuple, Path] | None = None
+        self.export_pool = ThreadPoolExecutor(max_workers=max(1, min(4, os.cpu_count() or 1)))
         app_icon_path = self.program_root / "asset" / "icon.ico"
         if app_icon_path.exists():
             app_icon = QIcon(str(app_icon_path))
@@ -251,12 +495,22 @@ class ARPlusWindow(QMainWindow):
         self.layer_move_preview_timer = QTimer(self)
         self.layer_move_preview_timer.setSingleShot(True)
         self.layer_move_preview_timer.timeout.connect(self._flush_layer_move_preview_refresh)
+        self.logo_shadow_timer = QTimer(self)
+        self.logo_shadow_timer.setSingleShot(True)
+        self.logo_shadow_timer.timeout.connect(self._start_logo_shadow_render)
+        self.position_info_timer = QTimer(self)
+        self.position_info_timer.setSingleShot(True)
+        self.position_info_timer.timeout.connect(self._update_position_info)
+        self.preview_settle_timer = QTimer(self)
+        self.preview_settle_timer.setSingleShot(True)
+        self.preview_settle_timer.timeout.connect(self._finish_preview_interaction)
 
         self.scene = QGraphicsScene(self)
         self.view = CanvasView(self)
         self.view.setScene(self.scene)
-        self.view.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        self.view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        # The scene only holds pixmaps and axis-aligned rects: pixmap items pick their own
+        # smoothing from their transformation mode, and antialiasing would only turn the
+        # clip rect into a slow antialiased clip path.
         self.view.setBackgroundBrush(QColor("#F3F1F3"))
         self.view.wheelScaled.connect(self._on_wheel_scaled)
 
@@ -274,6 +528,7 @@ class ARPlusWindow(QMainWindow):
                 item.setFlag(QGraphicsPixmapItem.GraphicsItemFlag.ItemIsMovable, False)
             item.moved.connect(self._on_layer_moved)
             item.clicked.connect(self._on_layer_clicked)
+            item.released.connect(self._on_layer_released)
             item.setParentItem(self.clip_item)
             self.items[layer] = item
 
@@ -300,7 +555,7 @@ class ARPlusWindow(QMainWindow):
         self.scene.addItem(self.frame_item)
 
         self._build_ui()
-        self._load_guides()
+        self._load_guides_async()
         self._set_scene_for_preset(self.current_preset)
         self._refresh_preview()
 
@@ -334,8 +589,8 @@ class ARPlusWindow(QMainWindow):
 
     def _build_default_state(self):
         state = {}
-        for preset_id, meta in PRESETS.items():
-            width, height = meta["size"]
+        for preset_id in PRESET_IDS:
+            width, height = PRESET_SIZES[preset_id]
             state[preset_id] = {layer: self._build_default_layer() for layer in LAYER_ORDER}
             state[preset_id]["background"]["fit_mode"] = "crop"
             for layer_id in CHARACTER_LAYERS:
@@ -794,6 +1049,7 @@ class ARPlusWindow(QMainWindow):
         self.progress = QProgressBar()
         self.log_box = QPlainTextEdit()
         self.log_box.setReadOnly(True)
+        self.log_message.connect(self.log_box.appendPlainText)
 
         exports_layout.addWidget(QLabel("Dossier"))
         exports_layout.addWidget(self.export_dir)
@@ -812,15 +1068,8 @@ class ARPlusWindow(QMainWindow):
         pos_box = QGroupBox("Positions (px)")
         pos_layout = QVBoxLayout(pos_box)
         self.position_labels: Dict[str, QLabel] = {}
-        label_map = {
-            "background": "Background",
-            "character": "Perso",
-            "character2": "Perso 2",
-            "character3": "Perso 3",
-            "character4": "Perso 4",
-            "logo": "Logo",
-        }
-        for layer_id, label in label_map.items():
+        self.position_label_texts: Dict[str, str] = {}
+        for layer_id in POSITION_LABEL_NAMES:
             row = QLabel()
             self.position_labels[layer_id] = row
             pos_layout.addWidget(row)
@@ -866,7 +1115,7 @@ class ARPlusWindow(QMainWindow):
         return box
 
     def _set_scene_for_preset(self, preset_id: str):
-        width, height = PRESETS[preset_id]["size"]
+        width, height = PRESET_SIZES[preset_id]
         self.scene.setSceneRect(0, 0, width, height)
         self.clip_item.setRect(0, 0, width, height)
         self.frame_item.setRect(0, 0, width, height)
@@ -895,6 +1144,7 @@ class ARPlusWindow(QMainWindow):
             self._autosave_project_snapshot(f"{base_name}-exit")
         except Exception:
             pass
+        self.export_pool.shutdown(wait=False, cancel_futures=True)
         super().closeEvent(event)
 
     def _selected_layer(self) -> str:
@@ -904,13 +1154,23 @@ class ARPlusWindow(QMainWindow):
         return self.state[preset_id][layer_id]
 
     def _log(self, message: str):
-        self.log_box.appendPlainText(message)
+        # Routed through a signal so layer renders running on export_pool can log safely.
+        self.log_message.emit(message)
 
     def _schedule_live_preview_refresh(self):
         self.live_refresh_pending = True
-        if hasattr(self, "live_refresh_timer"):
+        # Throttle rather than debounce: a running timer is left alone, so a continuous
+        # drag still refreshes once per interval instead of waiting for the slider to stop.
+        if hasattr(self, "live_refresh_timer") and not self.live_refresh_timer.isActive():
             self.live_refresh_timer.start(self.live_refresh_interval_ms)
 
+    def _schedule_preview_refresh(self):
+        # Discrete edits (toggles, combos, color picks) refresh on the next event-loop pass,
+        # so several landing together cost one refresh; a pending live refresh absorbs them.
+        self.live_refresh_pending = True
+        if hasattr(self, "live_refresh_timer") and not self.live_refresh_timer.isActive():
+            self.live_refresh_timer.start(0)
+
     def _flush_live_preview_refresh(self):
         if not self.live_refresh_pending:
             return
@@ -921,8 +1181,39 @@ class ARPlusWindow(QMainWindow):
         self.live_refresh_pending = False
         if hasattr(self, "live_refresh_timer"):
             self.live_refresh_timer.stop()
+        self._end_preview_interaction()
         self._refresh_preview()
 
+    def _begin_preview_interaction(self, rescaling: bool = True):
+        # Gestures draw items with fast transforms (and rescale pixmaps fast when the gesture
+        # changes scale); smooth rendering comes back once they settle or the slider is released.
+        if rescaling:
+            self.preview_interacting = True
+        if not self.preview_items_fast:
+            self._set_preview_items_transformation_mode(Qt.TransformationMode.FastTransformation)
+            self.preview_items_fast = True
+        if hasattr(self, "preview_settle_timer"):
+            self.preview_settle_timer.start(self.preview_settle_interval_ms)
+
+    def _end_preview_interaction(self):
+        if hasattr(self, "preview_settle_timer"):
+            self.preview_settle_timer.stop()
+        self.preview_interacting = False
+        if self.preview_items_fast:
+            self._set_preview_items_transformation_mode(Qt.TransformationMode.SmoothTransformation)
+            self.preview_items_fast = False
+
+    def _finish_preview_interaction(self):
+        rescaled = self.preview_interacting
+        self._end_preview_interaction()
+        if rescaled:
+            self._refresh_preview_now()
+
+    def _set_preview_items_transformation_mode(self, mode: Qt.TransformationMode):
+        # Only the layer items draw smoothly; guide and textbox items keep Qt's fast default.
+        for item in self.items.values():
+            item.setTransformationMode(mode)
+
     def _schedule_layer_move_preview_refresh(self):
         self.layer_move_refresh_pending = True
         if hasattr(self, "layer_move_preview_timer"):
@@ -958,7 +1249,7 @@ class ARPlusWindow(QMainWindow):
 
     def _on_guides_visible_toggled(self, checked: bool):
         self.guides_visible = checked
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_poster_guide_variant_changed(self):
         if not hasattr(self, "poster_guide_combo"):
@@ -968,7 +1259,7 @@ class ARPlusWindow(QMainWindow):
             return
         self.poster_guide_variant = selected
         self._load_guides()
-        for layer_id in [*CHARACTER_LAYERS, "logo"]:
+        for layer_id in POSTER_AUTO_PLACE_LAYERS:
             layer_pixmap = self.assets[layer_id].pixmap
             if layer_pixmap is None or layer_pixmap.isNull():
                 continue
@@ -979,39 +1270,45 @@ class ARPlusWindow(QMainWindow):
 
     def _on_logo_text_toggle(self, checked: bool):
         self.logo_text_enabled = checked
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_preview_refresh()
 
     def _on_logo_text_changed(self):
         self.logo_text = self.logo_text_input.toPlainText().strip()
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_live_preview_refresh()
 
     def _on_logo_text_size_changed(self, value: int):
         self.logo_text_size = value
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_live_preview_refresh()
 
     def _on_logo_text_align_changed(self):
         self.logo_text_align = self.logo_text_align_combo.currentData()
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_preview_refresh()
 
     def _on_logo_text_upper_toggled(self, checked: bool):
         self.logo_text_force_upper = checked
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_preview_refresh()
 
     def _on_logo_text_line_spacing_changed(self, value: int):
         self.logo_text_line_spacing = value
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_layer_render_cache("logo")
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_live_preview_refresh()
 
     def _on_poster_textbox_toggled(self, checked: bool):
         self.poster_textbox_enabled = checked
         self._sync_poster_textbox_controls()
         self._invalidate_presets_preview(["poster"])
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_poster_textbox_changed(self, value: str):
         upper_value = value.upper()
@@ -1021,53 +1318,53 @@ class ARPlusWindow(QMainWindow):
             self.poster_textbox_input.blockSignals(False)
         self.poster_textbox_text = upper_value
         self._invalidate_presets_preview(["poster"])
-        self._refresh_preview()
+        self._schedule_live_preview_refresh()
 
     def _on_logo_shadow_toggled(self, checked: bool):
         self.logo_shadow_enabled = checked
-        self._invalidate_presets_preview()
-        self._refresh_preview()
+        self._invalidate_presets_preview(layers=["logo"])
+        self._schedule_preview_refresh()
 
     def _on_logo_shadow_distance_changed(self, value: int):
         self.logo_shadow_distance = max(0, min(50, value))
         self._update_shadow_slider_labels()
-        self._invalidate_presets_preview()
+        self._invalidate_presets_preview(layers=["logo"])
         self._schedule_live_preview_refresh()
 
     def _on_logo_shadow_blur_changed(self, value: int):
         self.logo_shadow_blur = max(0, min(50, value))
         self._update_shadow_slider_labels()
-        self._invalidate_presets_preview()
+        self._invalidate_presets_preview(layers=["logo"])
         self._schedule_live_preview_refresh()
 
     def _on_logo_shadow_angle_changed(self, value: int):
         self.logo_shadow_angle = value % 360
         self._update_shadow_slider_labels()
-        self._invalidate_presets_preview()
+        self._invalidate_presets_preview(layers=["logo"])
         self._schedule_live_preview_refresh()
 
     def _on_logo_shadow_opacity_changed(self, value: int):
         self.logo_shadow_opacity = value
         self._update_shadow_slider_labels()
-        self._invalidate_presets_preview()
+        self._invalidate_presets_preview(layers=["logo"])
         self._schedule_live_preview_refresh()
 
     def _on_gradient_enabled_toggled(self, checked: bool):
         self._gradient_config()["enabled"] = checked
         self._sync_gradient_controls()
         self._invalidate_presets_preview([self.current_preset])
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_gradient_mode_changed(self):
         self._gradient_config()["mode"] = self.gradient_mode_combo.currentData()
         self._sync_gradient_controls()
         self._invalidate_presets_preview([self.current_preset])
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_gradient_direction_changed(self):
         self._gradient_config()["direction"] = self.gradient_direction_combo.currentData()
         self._invalidate_presets_preview([self.current_preset])
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_gradient_distance_changed(self, value: int):
         self._gradient_config()["distance"] = value
@@ -1125,48 +1422,47 @@ class ARPlusWindow(QMainWindow):
         return self.logo_text.upper() if self.logo_text_force_upper else self.logo_text
 
     def _logo_shadow_offset(self) -> Tuple[int, int]:
-        angle_rad = math.radians(self.logo_shadow_angle)
-        dx = int(round(math.cos(angle_rad) * self.logo_shadow_distance))
-        dy = int(round(math.sin(angle_rad) * self.logo_shadow_distance))
+        cos_a, sin_a = SHADOW_ANGLE_VECTORS[int(self.logo_shadow_angle) % 360]
+        dx = int(round(cos_a * self.logo_shadow_distance))
+        dy = int(round(sin_a * self.logo_shadow_distance))
         return dx, dy
 
     def _logo_shadow_rgba(self) -> Tuple[int, int, int, int]:
-        color = QColor(self.logo_shadow_color)
-        if not color.isValid():
-            color = QColor("#000000")
+        red, green, blue = _parse_hex_rgb(self.logo_shadow_color, "#000000")
         alpha = max(0, min(255, int(round((self.logo_shadow_opacity / 100) * 255))))
-        return color.red(), color.green(), color.blue(), alpha
+        return red, green, blue, alpha
 
-    def _apply_logo_shadow_pil(self, source: Image.Image):
-        if not self.logo_shadow_enabled:
-            return source
+    def _logo_shadow_params(self) -> tuple:
+        return max(0, int(self.logo_shadow_blur)), self._logo_shadow_offset(), self._logo_shadow_rgba()
 
-        src = source.convert("RGBA")
-        blur = max(0, int(self.logo_shadow_blur))
-        dx, dy = self._logo_shadow_offset()
-        red, green, blue, alpha = self._logo_shadow_rgba()
+    def _apply_logo_shadow_pil(
+        self,
+        source: Image.Image,
+        params: tuple | None = None,
+        template_key: int | None = None,
+    ):
+        if params is None:
+            if not self.logo_shadow_enabled:
+                return source
+            params = self._logo_shadow_params()
 
-        alpha_mask = src.getchannel("A").point(lambda px: int((px * alpha) / 255))
-        shadow_core = Image.new("RGBA", src.size, (red, green, blue, 0))
-        shadow_core.putalpha(alpha_mask)
+        src = source.convert("RGBA")
+        blur, (dx, dy), (red, green, blue, alpha) = params
 
-        shadow_img = shadow_core
-        shadow_shift_x = 0
-        shadow_shift_y = 0
-        if blur > 0:
-            pad = blur * 2
-            shadow_padded = Image.new(
-                "RGBA",
-                (src.width + (pad * 2), src.height + (pad * 2)),
-                (0, 0, 0, 0),
-            )
-            shadow_padded.alpha_composite(shadow_core, (pad, pad))
-            shadow_img = shadow_padded.filter(ImageFilter.GaussianBlur(radius=blur))
-            shadow_shift_x = -pad
-            shadow_shift_y = -pad
+        # The blurred mask only depends on the source, the blur and the opacity; moving the
+        # shadow or changing its color reuses it when the caller can identify the source.
+        template = self.logo_shadow_template
+        if template_key is not None and template is not None and template[0] == (template_key, blur, alpha):
+            alpha_mask, pad = template[1]
+        else:
+            alpha_mask, pad = self._blur_logo_shadow_mask(src, blur, alpha)
+            if template_key is not None:
+                self.logo_shadow_template = ((template_key, blur, alpha), (alpha_mask, pad))
+        shadow_img = Image.new("RGBA", alpha_mask.size, (red, green, blue, 0))
+        shadow_img.putalpha(alpha_mask)
 
-        shadow_x = dx + shadow_shift_x
-        shadow_y = dy + shadow_shift_y
+        shadow_x = dx - pad
+        shadow_y = dy - pad
 
         # Keep logo anchor stable: enlarge symmetrically around source so only shadow appears to move.
         left_over = max(0, -shadow_x)
@@ -1185,37 +1481,142 @@ class ARPlusWindow(QMainWindow):
         canvas.alpha_composite(src, (pad_x, pad_y))
         return canvas
 
+    def _blur_logo_shadow_mask(self, src: Image.Image, blur: int, alpha: int) -> Tuple[Image.Image, int]:
+        alpha_mask = src.getchannel("A")
+        if alpha < 255:
+            alpha_mask = alpha_mask.point(_shadow_alpha_lut(alpha))
+        # Only the alpha varies across the shadow, so the blur runs on that single band
+        # and the flat shadow color is attached afterwards.
+        if blur > 0:
+            pad = blur * 2
+            alpha_padded = Image.new("L", (src.width + (pad * 2), src.height + (pad * 2)), 0)
+            alpha_padded.paste(alpha_mask, (pad, pad))
+            if blur >= SHADOW_DOWNSAMPLE_MIN_BLUR:
+                # A wide blur has no detail worth keeping at full resolution: blur a reduced
+                # copy with a proportionally smaller radius, then scale it back up.
+                factor = max(2, min(SHADOW_DOWNSAMPLE_MAX_FACTOR, blur // 4))
+                reduced = alpha_padded.reduce(factor)
+                reduced = reduced.filter(ImageFilter.GaussianBlur(radius=blur / factor))
+                # reduce() rounds a partial last block up to a whole pixel; mapping back from
+                # the exact covered area keeps the shadow aligned when the size isn't a multiple.
+                alpha_mask = reduced.resize(
+                    alpha_padded.size,
+                    Image.Resampling.BILINEAR,
+                    box=(0, 0, alpha_padded.width / factor, alpha_padded.height / factor),
+                )
+            else:
+                alpha_mask = alpha_padded.filter(ImageFilter.GaussianBlur(radius=blur))
+            return alpha_mask, pad
+        return alpha_mask, 0
+
     def _qpixmap_to_pil(self, pixmap: QPixmap):
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, "PNG")
-        return Image.open(BytesIO(bytes(buffer.data()))).convert("RGBA")
+        return self._qimage_to_pil(pixmap.toImage())
 
     def _pil_to_qpixmap(self, image: Image.Image) -> QPixmap:
-        png_bytes = BytesIO()
-        image.save(png_bytes, format="PNG")
-        pixmap = QPixmap()
-        pixmap.loadFromData(png_bytes.getvalue(), "PNG")
-        return pixmap
+        # Hand the raw RGBA bytes to Qt instead of encoding and decoding a PNG.
+        # QPixmap.fromImage() copies the pixels, so the temporary buffer can go right after.
+        rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+        data = rgba.tobytes("raw", "RGBA")
+        qimage = QImage(data, rgba.width, rgba.height, rgba.width * 4, QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(qimage)
+
+    def _qimage_to_pil(self, image: QImage) -> Image.Image:
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        return Image.frombytes(
+            "RGBA",
+            (image.width(), image.height()),
+            bytes(image.constBits()),
+            "raw",
+            "RGBA",
+            image.bytesPerLine(),
+        )
+
+    def _pil_to_qimage(self, image: Image.Image) -> QImage:
+        if image.mode == "RGB":
+            # Opaque images (guides) go through RGB888 instead of being widened to RGBA first.
+            data = image.tobytes("raw", "RGB")
+            return QImage(data, image.width, image.height, image.width * 3, QImage.Format.Format_RGB888).copy()
+        rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+        data = rgba.tobytes("raw", "RGBA")
+        return QImage(data, rgba.width, rgba.height, rgba.width * 4, QImage.Format.Format_RGBA8888).copy()
 
     def _apply_logo_shadow_preview(self, pixmap: QPixmap) -> QPixmap:
         if not self.logo_shadow_enabled:
             return pixmap
-        try:
-            source = self._qpixmap_to_pil(pixmap)
-            shadowed = self._apply_logo_shadow_pil(source)
-            return self._pil_to_qpixmap(shadowed)
-        except Exception:
+        # The blur runs on the thread pool; until it lands, keep showing the last shadow so
+        # slider drags never wait on it. The timer is left running when already started, so
+        # a continuous drag still gets a new shadow every interval.
+        params = self._logo_shadow_params()
+        key = (pixmap.cacheKey(), params, (pixmap.width(), pixmap.height()))
+        result = self.logo_shadow_result
+        if result is not None and result[0] == key:
+            return result[1]
+        if self.logo_shadow_pending is None or self.logo_shadow_pending[0] != key:
+            self.logo_shadow_pending = (key, pixmap.toImage(), params)
+            if not self.logo_shadow_timer.isActive():
+                self.logo_shadow_timer.start(self.logo_shadow_interval_ms)
+        if result is None:
+            return pixmap
+        if result[0][0] == key[0]:
+            return result[1]
+        # A scale drag or text edit builds a new pixmap each step: stretch the last shadow
+        # by the same ratio as the logo (the padding is symmetric, so it stays centered).
+        (_cache_key, _params, (source_w, source_h)), shadowed = result
+        if source_w <= 0 or source_h <= 0:
             return pixmap
+        return shadowed.scaled(
+            max(1, round(shadowed.width() * pixmap.width() / source_w)),
+            max(1, round(shadowed.height() * pixmap.height() / source_h)),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _start_logo_shadow_render(self):
+        if self.logo_shadow_pending is None:
+            return
+        key, image, params = self.logo_shadow_pending
+        self.logo_shadow_revision += 1
+        task = BackgroundRenderTask(
+            partial(self._render_logo_shadow_image, params, key[0]),
+            self.logo_shadow_revision,
+            key,
+            image,
+        )
+        task.finished.connect(self._on_logo_shadow_rendered)
+        QThreadPool.globalInstance().start(task)
+
+    def _render_logo_shadow_image(self, params: tuple, template_key: int, image: QImage) -> QImage:
+        shadowed = self._apply_logo_shadow_pil(self._qimage_to_pil(image), params, template_key)
+        return self._pil_to_qimage(shadowed)
+
+    def _on_logo_shadow_rendered(self, revision: int, key: tuple, image: QImage | None, error: str):
+        # Renders are throttled, not cancelled: any result newer than the one shown is kept,
+        # so a long drag keeps updating even when each blur outlasts the interval.
+        if revision <= self.logo_shadow_result_revision:
+            return
+        self.logo_shadow_result_revision = revision
+        if self.logo_shadow_pending is not None and self.logo_shadow_pending[0] == key:
+            self.logo_shadow_pending = None
+        if image is None:
+            self._log(f"Erreur ombre logo: {error}")
+            return
+        self.logo_shadow_result = (key, QPixmap.fromImage(image))
+        self.last_layer_render_keys.pop("logo", None)
+        self._refresh_preview()
 
     def _gradient_color_rgb(self, hex_color: str, fallback: str) -> Tuple[int, int, int]:
-        color = QColor(hex_color)
-        if not color.isValid():
-            color = QColor(fallback)
-        return color.red(), color.green(), color.blue()
+        return _parse_hex_rgb(hex_color, fallback)
 
-    def _build_gradient_image(self, canvas_w: int, canvas_h: int, preset_id: str | None = None):
-        config = self._gradient_config(preset_id)
+    def _build_gradient_image(
+        self,
+        canvas_w: int,
+        canvas_h: int,
+        preset_id: str | None = None,
+        ramp_filter=None,
+        config: dict | None = None,
+    ):
+        if config is None:
+            config = self._gradient_config(preset_id)
         if not config["enabled"]:
             return None
         if canvas_w <= 0 or canvas_h <= 0:
@@ -1230,61 +1631,94 @@ class ARPlusWindow(QMainWindow):
 
         color_a = self._gradient_color_rgb(config["color_a"], "#000000")
         color_b = self._gradient_color_rgb(config["color_b"], "#FFFFFF")
-        ramp_data = []
-        for idx in range(axis_size):
-            if direction in {"top", "left"}:
-                axis_pos = idx
-            else:
-                axis_pos = (axis_size - 1) - idx
-            t = min(1.0, axis_pos / distance_px)
-            t = min(1.0, max(0.0, t ** (1.0 / stretch_ratio)))
-
-            if mode == "double":
-                red = int(round(color_a[0] + ((color_b[0] - color_a[0]) * t)))
-                green = int(round(color_a[1] + ((color_b[1] - color_a[1]) * t)))
-                blue = int(round(color_a[2] + ((color_b[2] - color_a[2]) * t)))
-                alpha = 255
-            else:
-                red, green, blue = color_a
-                alpha = int(round((1.0 - t) * 255))
-            ramp_data.append((red, green, blue, alpha))
-
+        exponent = 1.0 / stretch_ratio
+        # Past distance_px the ramp is flat (t == 1), so only the varying span is generated
+        # and expanded; the rest of the canvas is a plain fill.
+        varying = min(axis_size, distance_px)
+        if direction in {"top", "left"}:
+            positions = range(varying)
+            offset = 0
+        else:
+            positions = range(varying - 1, -1, -1)
+            offset = axis_size - varying
+        t_values = [min(1.0, max(0.0, min(1.0, axis_pos / distance_px) ** exponent)) for axis_pos in positions]
+
+        # Each channel is built as raw bytes and merged once, instead of a list of
+        # per-pixel RGBA tuples fed through putdata().
+        ramp_size = (1, varying) if vertical else (varying, 1)
+        if mode == "double":
+            bands = [
+                Image.frombytes("L", ramp_size, bytes(int(round(start + ((end - start) * t))) for t in t_values))
+                for start, end in zip(color_a, color_b)
+            ]
+            bands.append(Image.new("L", ramp_size, 255))
+            tail_color = (*color_b, 255)
+        else:
+            bands = [Image.new("L", ramp_size, value) for value in color_a]
+            bands.append(Image.frombytes("L", ramp_size, bytes(int(round((1.0 - t) * 255)) for t in t_values)))
+            tail_color = (*color_a, 0)
+        ramp = Image.merge("RGBA", bands)
+        if ramp_filter is not None:
+            # Per-pixel post-processing (export opacity/isolation) is applied to the
+            # 1-D ramp and the tail color, before anything is expanded to canvas size.
+            ramp = ramp_filter(ramp)
+            tail_color = ramp_filter(Image.new("RGBA", (1, 1), tail_color)).getpixel((0, 0))
+        # The ramp already has one sample per pixel along its axis, so only the
+        # cross axis is expanded; NEAREST just repeats it and avoids premultiplying alpha.
         if vertical:
-            ramp = Image.new("RGBA", (1, axis_size), (0, 0, 0, 0))
-            ramp.putdata(ramp_data)
+            span = ramp.resize((canvas_w, varying), Image.Resampling.NEAREST)
+            span_pos = (0, offset)
         else:
-            ramp = Image.new("RGBA", (axis_size, 1), (0, 0, 0, 0))
-            ramp.putdata(ramp_data)
-        return ramp.resize((canvas_w, canvas_h), Image.Resampling.BILINEAR)
+            span = ramp.resize((varying, canvas_h), Image.Resampling.NEAREST)
+            span_pos = (offset, 0)
+        if varying == axis_size:
+            return span
+        gradient = Image.new("RGBA", (canvas_w, canvas_h), tail_color)
+        gradient.paste(span, span_pos)
+        return gradient
 
     def _draw_logo_preview_text(self, painter: QPainter, draw_rect, logo_text: str):
-        metrics = QFontMetrics(painter.font())
+        font = painter.font()
+        metrics = _qt_font_metrics(font.family(), font.pointSize(), font.bold())
         lines = self._logo_text_lines(logo_text)
         ratio = self._logo_line_spacing_ratio()
         line_step = max(1, int(metrics.height() * ratio))
         block_height = metrics.height() + (line_step * max(0, len(lines) - 1))
-        y = draw_rect.center().y() - (block_height // 2) + metrics.ascent()
+        center = draw_rect.center()
+        y = center.y() - (block_height // 2) + metrics.ascent()
 
+        align = self.logo_text_align
+        left = draw_rect.left()
+        right = draw_rect.right()
+        center_x = center.x()
         for line in lines:
             text_w = metrics.horizontalAdvance(line)
-            if self.logo_text_align == "left":
-                x = draw_rect.left()
-            elif self.logo_text_align == "right":
-                x = draw_rect.right() - text_w
+            if align == "left":
+                x = left
+            elif align == "right":
+                x = right - text_w
             else:
-                x = draw_rect.center().x() - (text_w // 2)
+                x = center_x - (text_w // 2)
             painter.drawText(int(x), int(y), line)
             y += line_step
 
+    def _logo_text_render_key(self, logo_text: str) -> tuple:
+        return (
+            logo_text,
+            self.logo_text_color,
+            self.logo_text_size,
+            self.logo_text_align,
+            self.logo_text_line_spacing,
+        )
+
     def _build_logo_preview_pixmap(self, logo_text: str) -> QPixmap:
-        probe = QPixmap(1, 1)
-        probe.fill(Qt.GlobalColor.transparent)
-        probe_painter = QPainter(probe)
-        font = probe_painter.font()
-        font.setBold(True)
-        font.setPointSize(self._logo_preview_point_size())
-        probe_painter.setFont(font)
-        metrics = QFontMetrics(font)
+        cache_key = self._logo_text_render_key(logo_text)
+        cached = self.logo_preview_cache.get(cache_key)
+        if cached is not None:
+            self.logo_preview_cache.move_to_end(cache_key)
+            return cached
+        font = _qt_bold_font(self._logo_preview_point_size())
+        metrics = _qt_font_metrics(font.family(), font.pointSize(), True)
         lines = self._logo_text_lines(logo_text)
         line_widths = [
             max(1, metrics.horizontalAdvance(line) if line else metrics.horizontalAdvance(" "))
@@ -1295,7 +1729,6 @@ class ARPlusWindow(QMainWindow):
         text_h = metrics.height() + (line_step * max(0, len(lines) - 1))
         pad_x = max(12, metrics.horizontalAdvance("M") // 2)
         pad_y = max(12, metrics.height() // 3)
-        probe_painter.end()
 
         pixmap = QPixmap(max(1, text_w + (pad_x * 2)), max(1, text_h + (pad_y * 2)))
         pixmap.fill(Qt.GlobalColor.transparent)
@@ -1308,26 +1741,31 @@ class ARPlusWindow(QMainWindow):
             logo_text,
         )
         painter.end()
+        self.logo_preview_cache[cache_key] = pixmap
+        while len(self.logo_preview_cache) > LOGO_RENDER_CACHE_SIZE:
+            self.logo_preview_cache.popitem(last=False)
         return pixmap
 
     def _build_logo_export_image(self, logo_text: str):
+        cache_key = self._logo_text_render_key(logo_text)
+        # Export renders run on export_pool, so the cache is shared across threads.
+        with self.render_cache_lock:
+            cached = self.logo_export_cache.get(cache_key)
+            if cached is not None:
+                self.logo_export_cache.move_to_end(cache_key)
+                return cached
         font = self._logo_font_for_export()
         spacing = self._logo_export_spacing()
         lines = self._logo_text_lines(logo_text)
 
-        probe = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
-        measure = ImageDraw.Draw(probe)
-        sample_bbox = measure.textbbox((0, 0), "Ag", font=font)
+        sample_bbox = _font_text_bbox(font, "Ag")
         line_height = max(1, sample_bbox[3] - sample_bbox[1])
 
         line_boxes = []
-        max_width = 1
         for line in lines:
-            token = line if line else " "
-            bbox = measure.textbbox((0, 0), token, font=font)
-            width = max(1, bbox[2] - bbox[0])
-            line_boxes.append((line, bbox, width))
-            max_width = max(max_width, width)
+            bbox = _font_text_bbox(font, line if line else " ")
+            line_boxes.append((line, bbox, max(1, bbox[2] - bbox[0])))
+        max_width = max((width for _line, _bbox, width in line_boxes), default=1)
 
         text_h = (line_height * len(lines)) + (spacing * max(0, len(lines) - 1))
         pad_x = max(16, int(self._logo_effective_size() * 0.45))
@@ -1339,11 +1777,14 @@ class ARPlusWindow(QMainWindow):
         )
         draw = ImageDraw.Draw(img)
 
+        align = self.logo_text_align
+        fill = self.logo_text_color
+        line_advance = line_height + spacing
         y = pad_y
         for line, bbox, line_w in line_boxes:
-            if self.logo_text_align == "left":
+            if align == "left":
                 x = pad_x
-            elif self.logo_text_align == "right":
+            elif align == "right":
                 x = pad_x + (max_width - line_w)
             else:
                 x = pad_x + ((max_width - line_w) // 2)
@@ -1351,10 +1792,14 @@ class ARPlusWindow(QMainWindow):
                 draw.text(
                     (x - bbox[0], y - bbox[1]),
                     line,
-                    fill=self.logo_text_color,
+                    fill=fill,
                     font=font,
                 )
-            y += line_height + spacing
+            y += line_advance
+        with self.render_cache_lock:
+            self.logo_export_cache[cache_key] = img
+            while len(self.logo_export_cache) > LOGO_RENDER_CACHE_SIZE:
+                self.logo_export_cache.popitem(last=False)
         return img
 
     def _layer_offsets(
@@ -1374,7 +1819,7 @@ class ARPlusWindow(QMainWindow):
     def _enforce_logo_preset_layout(self, preset_id: str):
         if preset_id != "logo":
             return
-        width, height = PRESETS[preset_id]["size"]
+        width, height = PRESET_SIZES[preset_id]
         layer_state = self._layer_state(preset_id, "logo")
         layer_state["fit_mode"] = "contain"
         layer_state["transform"]["anchor"] = "bottom"
@@ -1390,20 +1835,10 @@ class ARPlusWindow(QMainWindow):
         return (text if text else "TEXTE BOX").upper()
 
     def _load_poster_textbox_font(self, size: int):
-        font_candidates = [
-            "Montserrat-Bold.ttf",
-            "Arialbd.ttf",
-            "/usr/share/fonts/truetype/montserrat/Montserrat-Bold.ttf",
-            "/Library/Fonts/Montserrat-Bold.ttf",
-            "C:/Windows/Fonts/montserrat-bold.ttf",
-            "C:/Windows/Fonts/arialbd.ttf",
-        ]
-        for candidate in font_candidates:
-            try:
-                return ImageFont.truetype(candidate, size)
-            except OSError:
-                continue
-        return ImageFont.load_default()
+        font = _load_truetype_font(POSTER_TEXTBOX_FONT_CANDIDATES, size)
+        if font is not None:
+            return font
+        return _load_default_font()
 
     def _build_poster_textbox_render(
         self,
@@ -1418,9 +1853,18 @@ class ARPlusWindow(QMainWindow):
         if not text:
             return None
 
+        size_factor = max(0.1, min(2.0, float(size_factor)))
+        # The box only depends on the text, the canvas width and the size factor.
+        cache_key = (text, canvas_w, size_factor)
+        # Strip thumbnails are composed on the thread pool, so the cache is shared across threads.
+        with self.render_cache_lock:
+            cached = self.poster_textbox_cache.get(cache_key)
+            if cached is not None:
+                self.poster_textbox_cache.move_to_end(cache_key)
+                return cached
+
         base = POSTER_TEXTBOX_BASE
         scale = canvas_w / 1600.0
-        size_factor = max(0.1, min(2.0, float(size_factor)))
         x = int(round(base["x"] * scale))
         y = int(round(base["y"] * scale))
         height = max(18, int(round(base["height"] * scale * size_factor)))
@@ -1471,7 +1915,12 @@ class ARPlusWindow(QMainWindow):
             fill=POSTER_TEXTBOX_BASE["text_color"],
             font=font,
         )
-        return box_img, x, y
+        result = (box_img, x, y)
+        with self.render_cache_lock:
+            self.poster_textbox_cache[cache_key] = result
+            while len(self.poster_textbox_cache) > POSTER_TEXTBOX_CACHE_SIZE:
+                self.poster_textbox_cache.popitem(last=False)
+        return result
 
     def _refresh_poster_textbox_overlay(self, canvas_w: int, canvas_h: int):
         if not hasattr(self, "poster_textbox_item"):
@@ -1481,11 +1930,17 @@ class ARPlusWindow(QMainWindow):
             self.poster_textbox_item.setVisible(False)
             return
         box_img, x, y = draw_data
-        pixmap = self._pil_to_qpixmap(box_img)
+        cached = self.poster_textbox_pixmap_cache
+        if cached is not None and cached[0] is box_img:
+            pixmap = cached[1]
+        else:
+            pixmap = self._pil_to_qpixmap(box_img)
+            self.poster_textbox_pixmap_cache = (box_img, pixmap)
         if pixmap.isNull():
             self.poster_textbox_item.setVisible(False)
             return
-        self.poster_textbox_item.setPixmap(pixmap)
+        if self.poster_textbox_item.pixmap().cacheKey() != pixmap.cacheKey():
+            self.poster_textbox_item.setPixmap(pixmap)
         self.poster_textbox_item.setOffset(0, 0)
         self.poster_textbox_item.setPos(x, y)
         self.poster_textbox_item.setVisible(True)
@@ -1494,45 +1949,54 @@ class ARPlusWindow(QMainWindow):
         color = QColorDialog.getColor(QColor(self.logo_text_color), self)
         if color.isValid():
             self.logo_text_color = color.name()
-            self._invalidate_presets_preview()
-            self._refresh_preview()
+            self._invalidate_layer_render_cache("logo")
+            self._invalidate_presets_preview(layers=["logo"])
+            self._schedule_preview_refresh()
 
     def _pick_logo_shadow_color(self):
         color = QColorDialog.getColor(QColor(self.logo_shadow_color), self)
         if color.isValid():
             self.logo_shadow_color = color.name()
-            self._invalidate_presets_preview()
-            self._refresh_preview()
+            self._invalidate_presets_preview(layers=["logo"])
+            self._schedule_preview_refresh()
 
     def _pick_gradient_color_a(self):
         color = QColorDialog.getColor(QColor(self._gradient_config()["color_a"]), self)
         if color.isValid():
             self._gradient_config()["color_a"] = color.name()
             self._invalidate_presets_preview([self.current_preset])
-            self._refresh_preview()
+            self._schedule_preview_refresh()
 
     def _pick_gradient_color_b(self):
         color = QColorDialog.getColor(QColor(self._gradient_config()["color_b"]), self)
         if color.isValid():
             self._gradient_config()["color_b"] = color.name()
             self._invalidate_presets_preview([self.current_preset])
-            self._refresh_preview()
+            self._schedule_preview_refresh()
 
     def _on_visible_changed(self, checked: bool):
+        if self.updating_ui:
+            return
         layer = self._selected_layer()
         self._layer_state(self.current_preset, layer)["visible"] = checked
-        self._refresh_preview()
+        self._schedule_preview_refresh()
 
     def _on_opacity_changed(self, value: int):
+        if self.updating_ui:
+            return
         layer = self._selected_layer()
         self._layer_state(self.current_preset, layer)["opacity"] = value / 100
         self._update_slider_value_labels()
+        self._begin_preview_interaction(rescaling=False)
         self._schedule_live_preview_refresh()
 
     def _on_scale_changed(self, value: int):
+        if self.updating_ui:
+            return
         layer = self._selected_layer()
         self._layer_state(self.current_preset, layer)["transform"]["scale"] = value / 100
         self._update_slider_value_labels()
+        self._begin_preview_interaction()
         self._schedule_live_preview_refresh()
 
     def _on_reset_layer(self):
@@ -1541,7 +2005,7 @@ class ARPlusWindow(QMainWindow):
         if layer == "background":
             self.state[self.current_preset][layer]["fit_mode"] = "crop"
         self._apply_auto_placement(layer, self.current_preset)
-        self._refresh_preview()
+        self._schedule_preview_refresh()
         self._sync_layer_controls()
 
     def _on_center_layer(self):
@@ -1549,7 +2013,7 @@ class ARPlusWindow(QMainWindow):
         if not self._is_layer_allowed(self.current_preset, layer):
             return
 
-        width, height = PRESETS[self.current_preset]["size"]
+        width, height = PRESET_SIZES[self.current_preset]
         layer_state = self._layer_state(self.current_preset, layer)
         layer_state["transform"]["x"] = width * 0.5
         if layer in CHARACTER_LAYERS:
@@ -1560,19 +2024,36 @@ class ARPlusWindow(QMainWindow):
                 layer_state["transform"]["y"] = (height * 0.5) + (pixmap.height() * 0.5)
         else:
             layer_state["transform"]["y"] = height * 0.5
-        self._refresh_preview()
+        self._schedule_preview_refresh()
         self._sync_layer_controls()
 
     def _on_layer_moved(self, layer_id: str, x: float, y: float):
         self._layer_state(self.current_preset, layer_id)["transform"]["x"] = x
         self._layer_state(self.current_preset, layer_id)["transform"]["y"] = y
-        self._update_position_info()
-        self._schedule_layer_move_preview_refresh()
+        # setPos() from a refresh also lands here; only a mouse drag counts as interaction.
+        dragging = bool(QApplication.mouseButtons() & Qt.MouseButton.LeftButton)
+        if dragging:
+            self._begin_preview_interaction(rescaling=False)
+        # A drag reports every mouse move; the position label only needs one update per frame.
+        if not self.position_info_timer.isActive():
+            self.position_info_timer.start(self.position_info_interval_ms)
+        if dragging:
+            # The thumbnail follows on release (_on_layer_released) instead of re-rendering
+            # whenever the drag pauses.
+            self.layer_move_refresh_pending = True
+            self.layer_move_preview_timer.stop()
+        else:
+            self._schedule_layer_move_preview_refresh()
+
+    def _on_layer_released(self, layer_id: str):
+        self.layer_move_preview_timer.stop()
+        self._flush_layer_move_preview_refresh()
 
     def _on_wheel_scaled(self, delta: float):
         layer = self._selected_layer()
         layer_state = self._layer_state(self.current_preset, layer)
         layer_state["transform"]["scale"] = max(0.0, min(1.0, layer_state["transform"]["scale"] + delta))
+        self._begin_preview_interaction()
         self._schedule_live_preview_refresh()
         self._sync_layer_controls()
 
@@ -1591,7 +2072,7 @@ class ARPlusWindow(QMainWindow):
     def _is_layer_allowed(self, preset_id: str, layer_id: str) -> bool:
         if preset_id == "logo":
             return layer_id == "logo"
-        if layer_id == "logo" and PRESETS[preset_id].get("skip_logo"):
+        if layer_id == "logo" and preset_id in SKIP_LOGO_PRESETS:
             return False
         return True
 
@@ -1623,22 +2104,26 @@ class ARPlusWindow(QMainWindow):
         if self.updating_ui:
             return
         self.updating_ui = True
-        self._sync_extra_character_layer_buttons()
-        layer = self._selected_layer()
-        if not self._is_control_layer_available(self.current_preset, layer):
-            for fallback in CONTROL_LAYER_ORDER:
-                if self._is_control_layer_available(self.current_preset, fallback):
-                    self._set_active_layer(fallback, sync=False)
-                    layer = fallback
-                    break
-        for lid, btn in self.layer_buttons.items():
-            btn.setEnabled(self._is_control_layer_available(self.current_preset, lid))
-        layer_state = self._layer_state(self.current_preset, layer)
-        self.visible_check.setChecked(layer_state["visible"])
-        self.opacity_slider.setValue(int(layer_state["opacity"] * 100))
-        self.scale_slider.setValue(int(layer_state["transform"]["scale"] * 100))
-        self._update_slider_value_labels()
-        self.updating_ui = False
+        try:
+            self._sync_extra_character_layer_buttons()
+            layer = self._selected_layer()
+            if not self._is_control_layer_available(self.current_preset, layer):
+                for fallback in CONTROL_LAYER_ORDER:
+                    if self._is_control_layer_available(self.current_preset, fallback):
+                        self._set_active_layer(fallback, sync=False)
+                        layer = fallback
+                        break
+            for lid, btn in self.layer_buttons.items():
+                btn.setEnabled(self._is_control_layer_available(self.current_preset, lid))
+            layer_state = self._layer_state(self.current_preset, layer)
+            # Slider handlers ignore these updates, so syncing never rounds the state
+            # back through the integer slider values or schedules another refresh.
+            self.visible_check.setChecked(layer_state["visible"])
+            self.opacity_slider.setValue(int(layer_state["opacity"] * 100))
+            self.scale_slider.setValue(int(layer_state["transform"]["scale"] * 100))
+            self._update_slider_value_labels()
+        finally:
+            self.updating_ui = False
 
     def _import_layer(self, layer_id: str):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1650,25 +2135,18 @@ class ARPlusWindow(QMainWindow):
         if not file_path:
             return
 
-        try:
-            pil_img = Image.open(file_path).convert("RGBA")
-        except Exception as exc:
-            self._log(f"Erreur import {layer_id}: {exc}")
-            QMessageBox.critical(self, "Erreur", f"Impossible d'ouvrir l'image: {exc}")
-            return
-
-        pixmap = QPixmap(file_path)
-        if pixmap.isNull():
-            self._log(f"Erreur import {layer_id}: pixmap invalide")
+        loaded, error = self._load_layer_asset_from_file(layer_id, Path(file_path))
+        if not loaded:
+            self._log(f"Erreur import {layer_id}: {error}")
+            QMessageBox.critical(self, "Erreur", f"Impossible d'ouvrir l'image: {error}")
             return
 
-        self.assets[layer_id] = LayerAsset(path=file_path, pixmap=pixmap, pil=pil_img)
-        for preset_id in PRESETS:
+        for preset_id in PRESET_IDS:
             self._apply_auto_placement(layer_id, preset_id)
 
         if self._is_control_layer_available(self.current_preset, layer_id):
             self._set_active_layer(layer_id, sync=False)
-        self._invalidate_presets_preview()
+        self._invalidate_presets_preview(layers=[layer_id])
         self._log(f"Import {layer_id}: {file_path}")
         self._refresh_preview()
         self._sync_layer_controls()
@@ -1678,58 +2156,81 @@ class ARPlusWindow(QMainWindow):
         if (layer_pixmap is None or layer_pixmap.isNull()) and layer_id not in {"logo", "gradient"}:
             return
 
-        width, height = PRESETS[preset_id]["size"]
+        width, height = PRESET_SIZES[preset_id]
         layer_state = self._layer_state(preset_id, layer_id)
+        transform = layer_state["transform"]
 
         if layer_id == "background":
             layer_state["fit_mode"] = "crop"
-            layer_state["transform"]["x"] = width * 0.5
-            layer_state["transform"]["y"] = height * 0.5
-            layer_state["transform"]["scale"] = 1.0
-            layer_state["transform"]["anchor"] = "center"
+            transform["x"] = width * 0.5
+            transform["y"] = height * 0.5
+            transform["scale"] = 1.0
+            transform["anchor"] = "center"
         elif layer_id in CHARACTER_LAYERS:
             if layer_pixmap is not None and self._apply_guide_auto_placement(layer_id, preset_id, layer_pixmap):
                 return
             layer_state["fit_mode"] = "contain"
-            layer_state["transform"]["anchor"] = "bottom"
-            layer_state["transform"]["x"] = width * 0.5
-            layer_state["transform"]["scale"] = 1.0
+            transform["anchor"] = "bottom"
+            transform["x"] = width * 0.5
+            transform["scale"] = 1.0
             src_w = max(1, layer_pixmap.width())
             src_h = max(1, layer_pixmap.height())
             ratio = min(width / src_w, height / src_h)
             rendered_h = src_h * ratio
             # Keep initial placement visually centered while using a bottom anchor for scaling.
-            layer_state["transform"]["y"] = (height * 0.5) + (rendered_h * 0.5)
+            transform["y"] = (height * 0.5) + (rendered_h * 0.5)
         elif layer_id == "gradient":
             layer_state["fit_mode"] = "stretch"
-            layer_state["transform"]["anchor"] = "center"
-            layer_state["transform"]["x"] = width * 0.5
-            layer_state["transform"]["y"] = height * 0.5
-            layer_state["transform"]["scale"] = 1.0
+            transform["anchor"] = "center"
+            transform["x"] = width * 0.5
+            transform["y"] = height * 0.5
+            transform["scale"] = 1.0
         elif layer_id == "logo":
             if layer_pixmap is not None and self._apply_guide_auto_placement(layer_id, preset_id, layer_pixmap):
                 return
             layer_state["fit_mode"] = "contain"
-            layer_state["transform"]["scale"] = LOGO_PRESET_MIN_SCALE if preset_id == "logo" else 1.0
-            layer_state["transform"]["anchor"] = "bottom" if preset_id == "logo" else "center"
+            transform["scale"] = LOGO_PRESET_MIN_SCALE if preset_id == "logo" else 1.0
+            transform["anchor"] = "bottom" if preset_id == "logo" else "center"
             if preset_id == "logo":
                 # In logo preset, keep default placement centered and bottom-aligned.
-                layer_state["transform"]["x"] = width * 0.5
-                layer_state["transform"]["y"] = height
+                transform["x"] = width * 0.5
+                transform["y"] = height
             else:
-                layer_state["transform"]["x"] = width * 0.5
-                layer_state["transform"]["y"] = height * 0.5
+                transform["x"] = width * 0.5
+                transform["y"] = height * 0.5
 
     def _refresh_preview(self):
-        preset_meta = PRESETS[self.current_preset]
-        self._enforce_logo_preset_layout(self.current_preset)
-        canvas_w, canvas_h = preset_meta["size"]
-        self._refresh_guide_overlay(canvas_w, canvas_h)
-
+        preset_id = self.current_preset
+        self._enforce_logo_preset_layout(preset_id)
+        canvas_w, canvas_h = PRESET_SIZES[preset_id]
+        overlay_key = self._overlay_render_key(preset_id, canvas_w, canvas_h)
+        overlays_changed = overlay_key != self.last_overlay_render_key
+        if overlays_changed:
+            self.last_overlay_render_key = overlay_key
+            self._refresh_guide_overlay(canvas_w, canvas_h)
+
+        items = self.items
+        preset_state = self.state[preset_id]
+        last_render_keys = self.last_layer_render_keys
+        layers_changed = False
         for layer in RENDER_LAYER_ORDER:
-            item = self.items[layer]
-            layer_state = self._layer_state(self.current_preset, layer)
-            if not self._is_layer_allowed(self.current_preset, layer):
+            item = items[layer]
+            layer_state = preset_state[layer]
+            render_key = self._layer_render_key(layer, layer_state, canvas_w, canvas_h)
+            transform = layer_state["transform"]
+            position = (transform["x"], transform["y"])
+            last_key = last_render_keys.get(layer)
+            if last_key is not None and last_key[0] == render_key:
+                # Same pixmap, offset and opacity: a move only needs the item repositioned.
+                if last_key[1] != position:
+                    last_render_keys[layer] = (render_key, position)
+                    layers_changed = True
+                    if layer != "gradient" and item.isVisible():
+                        item.setPos(*position)
+                continue
+            last_render_keys[layer] = (render_key, position)
+            layers_changed = True
+            if not self._is_layer_allowed(preset_id, layer):
                 item.setVisible(False)
                 continue
             if not layer_state["visible"]:
@@ -1745,29 +2246,81 @@ class ARPlusWindow(QMainWindow):
             item.setOpacity(layer_state["opacity"])
             item.setPixmap(pixmap)
 
-            if layer in CHARACTER_LAYERS:
-                pos_x = layer_state["transform"]["x"]
-                pos_y = layer_state["transform"]["y"]
-                item.setOffset(-pixmap.width() / 2, -pixmap.height())
-                item.setPos(pos_x, pos_y)
-            elif layer == "gradient":
+            pixmap_w = pixmap.width()
+            pixmap_h = pixmap.height()
+            if layer == "gradient":
                 item.setOffset(0, 0)
                 item.setPos(0, 0)
+                continue
+            if layer in CHARACTER_LAYERS:
+                item.setOffset(-pixmap_w / 2, -pixmap_h)
             else:
-                pos_x = layer_state["transform"]["x"]
-                pos_y = layer_state["transform"]["y"]
                 offset_x, offset_y = self._layer_offsets(
-                    self.current_preset,
+                    preset_id,
                     layer,
                     layer_state,
-                    pixmap.width(),
-                    pixmap.height(),
+                    pixmap_w,
+                    pixmap_h,
                 )
                 item.setOffset(offset_x, offset_y)
-                item.setPos(pos_x, pos_y)
-        self._refresh_poster_textbox_overlay(canvas_w, canvas_h)
+            item.setPos(*position)
+        if overlays_changed:
+            self._refresh_poster_textbox_overlay(canvas_w, canvas_h)
+        # Nothing visible changed (e.g. a refresh fired by a control sync): the labels and
+        # the thumbnail are already up to date.
+        if not (layers_changed or overlays_changed):
+            return
         self._update_position_info()
-        self._request_presets_preview_refresh(preset_ids=[self.current_preset])
+        self._request_presets_preview_refresh(preset_ids=[preset_id])
+
+    def _overlay_render_key(self, preset_id: str, canvas_w: int, canvas_h: int) -> tuple:
+        guide_image = self.guide_images.get(preset_id)
+        return (
+            preset_id,
+            canvas_w,
+            canvas_h,
+            self.guides_visible,
+            self.guides_opacity,
+            guide_image.cacheKey() if guide_image is not None else None,
+            self.poster_textbox_enabled,
+            self.poster_textbox_text,
+        )
+
+    def _layer_render_key(self, layer_id: str, layer_state: dict, canvas_w: int, canvas_h: int) -> tuple:
+        # Everything that affects the pixmap, offset and opacity of a layer's preview item;
+        # the position is tracked next to it so moves can skip the rest of the update.
+        transform = layer_state["transform"]
+        key = (
+            self.current_preset,
+            self.preview_interacting,
+            canvas_w,
+            canvas_h,
+            layer_state["visible"],
+            layer_state["opacity"],
+            layer_state["fit_mode"],
+            tuple(sorted((name, value) for name, value in transform.items() if name not in ("x", "y"))),
+        )
+        if layer_id == "gradient":
+            return key + tuple(sorted(self._gradient_config(self.current_preset).items()))
+        pixmap = self.assets[layer_id].pixmap
+        key += (pixmap.cacheKey() if pixmap is not None else None,)
+        if layer_id == "logo":
+            key += (
+                self.logo_text_enabled,
+                self.logo_text,
+                self.logo_text_size,
+                self.logo_text_align,
+                self.logo_text_force_upper,
+                self.logo_text_line_spacing,
+                self.logo_text_color,
+                self.logo_shadow_enabled,
+                self.logo_shadow_distance,
+                self.logo_shadow_blur,
+                self.logo_shadow_angle,
+                self.logo_shadow_opacity,
+                self.logo_shadow_color,
+            )
+        return key
 
     def _compose_preset_canvas(
         self,
@@ -1776,72 +2329,95 @@ class ARPlusWindow(QMainWindow):
         render_scale: float = 1.0,
         resample=Image.Resampling.LANCZOS,
         textbox_scale_factor: float = 1.0,
+        snapshot: tuple | None = None,
     ):
+        # Without a snapshot the live state is used; a snapshot (see _preset_render_snapshot)
+        # lets thread-pool renders run without touching self.state. They then render their
+        # layers in turn instead of through export_pool, which stays free for exports.
         preset = PRESETS[preset_id]
-        self._enforce_logo_preset_layout(preset_id)
-        base_w, base_h = preset["size"]
+        if snapshot is None:
+            self._enforce_logo_preset_layout(preset_id)
+            preset_state = self.state[preset_id]
+            gradient_config = self._gradient_config(preset_id)
+        else:
+            preset_state, gradient_config = snapshot
+        base_w, base_h = PRESET_SIZES[preset_id]
         scale = max(0.02, min(1.0, float(render_scale)))
         canvas_w = max(1, int(round(base_w * scale)))
         canvas_h = max(1, int(round(base_h * scale)))
         canvas = Image.new("RGBA", (canvas_w, canvas_h), (0, 0, 0, 0))
 
+        # Layer resizes are independent and PIL releases the GIL while resampling,
+        # so render them in parallel and keep the compositing order on this thread.
+        render_jobs = []
         for layer in RENDER_LAYER_ORDER:
             if not self._is_layer_allowed(preset_id, layer):
                 continue
-            layer_state = self._layer_state(preset_id, layer)
+            layer_state = preset_state[layer]
             if not layer_state["visible"]:
                 continue
-
-            rendered = self._render_layer_for_export(
-                layer,
-                preset_id,
-                canvas_w=canvas_w,
-                canvas_h=canvas_h,
-                resample=resample,
-            )
-            if rendered is None:
-                continue
-
-            lw, lh = rendered.size
             if layer == "gradient":
-                x = 0
-                y = 0
-            else:
-                tx = layer_state["transform"]["x"] * scale
-                ty = layer_state["transform"]["y"] * scale
-                offset_x, offset_y = self._layer_offsets(
+                # The gradient covers the canvas and only varies along one axis, so it is
+                # isolated on its ramp and composited in a single full-size pass.
+                job = partial(
+                    self._composed_gradient_image,
+                    canvas_w,
+                    canvas_h,
                     preset_id,
+                    layer_state["opacity"],
+                    gradient_config,
+                )
+            else:
+                job = partial(
+                    self._render_layer_for_export,
                     layer,
+                    preset_id,
+                    canvas_w,
+                    canvas_h,
+                    resample,
                     layer_state,
-                    lw,
-                    lh,
                 )
-                x = int(tx + offset_x)
-                y = int(ty + offset_y)
+            if snapshot is None:
+                job = self.export_pool.submit(job).result
+            render_jobs.append((layer, layer_state, job))
+
+        for layer, layer_state, job in render_jobs:
+            rendered = job()
+            if rendered is None:
+                continue
+
+            if layer == "gradient":
+                canvas.alpha_composite(rendered)
+                continue
+
+            lw, lh = rendered.size
+            tx = layer_state["transform"]["x"] * scale
+            ty = layer_state["transform"]["y"] * scale
+            offset_x, offset_y = self._layer_offsets(
+                preset_id,
+                layer,
+                layer_state,
+                lw,
+                lh,
+            )
+            x = int(tx + offset_x)
+            y = int(ty + offset_y)
 
-            if log_upscale and self.assets[layer].pil and layer not in {"logo", "gradient"}:
+            if log_upscale and self.assets[layer].pil and layer != "logo":
                 sw, sh = self.assets[layer].pil.size
                 upscale_ratio = max(lw / sw, lh / sh)
                 if upscale_ratio > self.upscale_warning_ratio:
                     self._log(f"Avertissement upscale ({preset['label']} / {layer}): x{upscale_ratio:.2f}")
 
-            rendered_layer = rendered
-            if layer_state["opacity"] < 1.0:
-                rendered_layer = rendered.copy()
-                alpha = rendered_layer.getchannel("A").point(
-                    lambda px: int(px * layer_state["opacity"])
-                )
-                rendered_layer.putalpha(alpha)
-
-            # Compose through an isolated layer then alpha-composite on canvas.
-            # This keeps canvas alpha fully opaque when an opaque background already covers the preset.
-            composed_layer = Image.new("RGBA", (canvas_w, canvas_h), (0, 0, 0, 0))
-            composed_layer.paste(
-                rendered_layer,
-                (x, y),
-                rendered_layer.getchannel("A"),
-            )
-            canvas.alpha_composite(composed_layer)
+            # Only the part of the layer that lands on the canvas is isolated, instead of a full canvas.
+            x0 = max(0, x)
+            y0 = max(0, y)
+            x1 = min(canvas_w, x + lw)
+            y1 = min(canvas_h, y + lh)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            visible_part = rendered.crop((x0 - x, y0 - y, x1 - x, y1 - y))
+            canvas.alpha_composite(self._isolate_layer_pixels(visible_part, layer_state["opacity"]), (x0, y0))
 
         textbox_draw = self._build_poster_textbox_render(
             preset_id,
@@ -1854,19 +2430,88 @@ class ARPlusWindow(QMainWindow):
             canvas.alpha_composite(textbox_img, (textbox_x, textbox_y))
         return canvas
 
-    def _build_preset_thumbnail_pixmap(
+    def _composed_gradient_image(
+        self,
+        canvas_w: int,
+        canvas_h: int,
+        preset_id: str,
+        opacity: float,
+        config: dict | None = None,
+    ):
+        # The isolated gradient only depends on its settings, opacity and the canvas size, so
+        # every export, transparency check and thumbnail of an unchanged gradient reuses it.
+        if config is None:
+            config = self._gradient_config(preset_id)
+        key = (canvas_w, canvas_h, tuple(sorted(config.items())), opacity)
+        with self.render_cache_lock:
+            cached = self.gradient_image_cache.get(key)
+            if cached is not None:
+                self.gradient_image_cache.move_to_end(key)
+                return cached
+        rendered = self._build_gradient_image(
+            canvas_w,
+            canvas_h,
+            preset_id,
+            partial(self._isolate_layer_pixels, opacity=opacity),
+            config,
+        )
+        if rendered is None or canvas_w * canvas_h > GRADIENT_IMAGE_CACHE_MAX_PIXELS:
+            return rendered
+        with self.render_cache_lock:
+            self.gradient_image_cache[key] = rendered
+            while (
+                sum(image.width * image.height for image in self.gradient_image_cache.values())
+                > GRADIENT_IMAGE_CACHE_MAX_PIXELS
+            ):
+                self.gradient_image_cache.popitem(last=False)
+        return rendered
+
+    def _isolate_layer_pixels(self, image: Image.Image, opacity: float = 1.0) -> Image.Image:
+        # Compose through an isolated layer then alpha-composite on canvas.
+        # This keeps canvas alpha fully opaque when an opaque background already covers the preset.
+        if opacity < 1.0:
+            image = image.copy()
+            image.putalpha(image.getchannel("A").point(_opacity_lut(opacity)))
+        isolated = Image.new("RGBA", image.size, (0, 0, 0, 0))
+        # An RGBA image used as its own mask pastes through its alpha without a band copy.
+        isolated.paste(image, (0, 0), image)
+        return isolated
+
+    def _preset_thumbnail_cache_key(
         self,
         preset_id: str,
         max_w: int | None = None,
         max_h: int | None = None,
-    ):
+    ) -> tuple:
         if max_w is None:
             max_w = max(80, self.presets_preview_box_width - 8)
         if max_h is None:
             max_h = max(50, self.presets_preview_box_height - 8)
-        src_w, src_h = PRESETS[preset_id]["size"]
-        if src_w <= 0 or src_h <= 0:
+        # Several signatures per preset are kept, so stepping back to any recent state hits.
+        return (preset_id, max_w, max_h, self._preset_preview_signature(preset_id))
+
+    def _cached_preset_thumbnail(self, cache_key: tuple) -> QPixmap | None:
+        cached = self.preset_thumbnail_cache.get(cache_key)
+        if cached is not None:
+            self.preset_thumbnail_cache.move_to_end(cache_key)
+        return cached
+
+    def _store_preset_thumbnail(self, cache_key: tuple, image: QImage | None) -> QPixmap:
+        if image is None:
             return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+        self.preset_thumbnail_cache[cache_key] = pixmap
+        while len(self.preset_thumbnail_cache) > PRESET_THUMBNAIL_CACHE_SIZE:
+            self.preset_thumbnail_cache.popitem(last=False)
+        return pixmap
+
+    def _render_preset_thumbnail_image(self, cache_key: tuple, snapshot: tuple) -> QImage | None:
+        # Runs on the thread pool for the strip, from a state snapshot taken on the GUI thread:
+        # only builds a QImage, the pixmap and the cache are handled back on the GUI thread.
+        preset_id, max_w, max_h, _signature = cache_key
+        src_w, src_h = PRESET_SIZES[preset_id]
+        if src_w <= 0 or src_h <= 0:
+            return None
         ratio = min(max_w / src_w, max_h / src_h)
         ratio = max(0.02, min(1.0, ratio))
         quality_scale = max(0.1, min(1.0, float(self.presets_preview_quality_scale)))
@@ -1881,19 +2526,65 @@ class ARPlusWindow(QMainWindow):
                 render_scale=render_ratio,
                 resample=Image.Resampling.BICUBIC,
                 textbox_scale_factor=textbox_scale,
+                snapshot=snapshot,
             )
+            if image.size != (target_w, target_h):
+                image = image.resize((target_w, target_h), Image.Resampling.BICUBIC)
         except Exception:
-            return QPixmap()
-        if image.size != (target_w, target_h):
-            image = image.resize((target_w, target_h), Image.Resampling.BICUBIC)
-        return self._pil_to_qpixmap(image)
+            return None
+        return self._pil_to_qimage(image)
+
+    def _preset_render_snapshot(self, preset_id: str) -> tuple:
+        # Layer states only hold scalars plus the transform dict, so two levels of dict copies
+        # keep the worker off self.state. Other inputs are read live; renders overtaken by an
+        # edit are dropped on arrival (see _on_preset_thumbnail_rendered).
+        self._enforce_logo_preset_layout(preset_id)
+        preset_state = {
+            layer_id: {**layer_state, "transform": dict(layer_state["transform"])}
+            for layer_id, layer_state in self.state[preset_id].items()
+        }
+        return preset_state, dict(self._gradient_config(preset_id))
+
+    def _preset_preview_signature(self, preset_id: str) -> tuple:
+        # Everything a thumbnail depends on; dirty presets whose signature is unchanged
+        # (e.g. an edit that was undone, or a layer toggled back) reuse a cached thumbnail.
+        self._enforce_logo_preset_layout(preset_id)
+        asset_keys = []
+        for layer_id in LAYER_ORDER:
+            pixmap = self.assets[layer_id].pixmap
+            asset_keys.append(pixmap.cacheKey() if pixmap is not None else None)
+        # The preset state is digested so cache keys stay small however many are kept.
+        state_json = json.dumps(self.state[preset_id], sort_keys=True, separators=(",", ":"))
+        signature = (
+            hashlib.blake2b(state_json.encode("utf-8"), digest_size=16).digest(),
+            tuple(asset_keys),
+            tuple(sorted(self._gradient_config(preset_id).items())),
+            self.presets_preview_box_width,
+            self.presets_preview_box_height,
+            self.presets_preview_quality_scale,
+        )
+        if self._is_layer_allowed(preset_id, "logo"):
+            signature += (
+                self.logo_text_enabled,
+                self._logo_text_render_key(self._logo_display_text()),
+                self.logo_shadow_enabled,
+                self._logo_shadow_params(),
+            )
+        if preset_id == "poster":
+            signature += (self.poster_textbox_enabled, self.poster_textbox_text)
+        return signature
 
-    def _invalidate_presets_preview(self, preset_ids=None):
+    def _invalidate_presets_preview(self, preset_ids=None, layers=None):
         if preset_ids is None:
-            preset_ids = PRESETS.keys()
+            preset_ids = PRESET_IDS
         for preset_id in preset_ids:
-            if preset_id in PRESETS:
-                self.preset_preview_dirty.add(preset_id)
+            if preset_id not in PRESETS:
+                continue
+            # A change limited to some layers leaves presets that never render them untouched.
+            if layers is not None and not any(self._is_layer_allowed(preset_id, layer) for layer in layers):
+                continue
+            self.preset_preview_dirty.add(preset_id)
+            self.preset_preview_revisions[preset_id] += 1
 
     def _request_presets_preview_refresh(self, force: bool = False, preset_ids=None):
         if not hasattr(self, "preset_preview_labels"):
@@ -1909,10 +2600,13 @@ class ARPlusWindow(QMainWindow):
         if not hasattr(self, "preset_preview_labels"):
             return
         for preset_id, label in self.preset_preview_labels.items():
-            border_color = "#D78EF1" if preset_id == self.current_preset else "#5E5E66"
-            label.setStyleSheet(
-                f"border: 2px solid {border_color}; background-color: #1F1F24;"
-            )
+            self._apply_preset_preview_border(preset_id, label)
+
+    def _apply_preset_preview_border(self, preset_id: str, label: QLabel):
+        style = PRESET_PREVIEW_STYLE_ACTIVE if preset_id == self.current_preset else PRESET_PREVIEW_STYLE_INACTIVE
+        # Setting a stylesheet re-polishes the label even when the text is identical.
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
 
     def _refresh_presets_preview_strip(self):
         if not hasattr(self, "preset_preview_labels"):
@@ -1920,12 +2614,13 @@ class ARPlusWindow(QMainWindow):
         if not self.preset_preview_dirty:
             self._refresh_presets_preview_borders()
             return
-        if not self.preset_preview_queue:
-            ordered_ids = [preset_id for preset_id in PRESETS if preset_id in self.preset_preview_dirty]
-            if self.current_preset in ordered_ids:
-                ordered_ids.remove(self.current_preset)
-                ordered_ids.insert(0, self.current_preset)
-            self.preset_preview_queue = ordered_ids
+        # One slot per preset: re-queuing a preset only refreshes its revision, so bursts of
+        # edits never grow the queue. The current preset goes first.
+        for preset_id in PRESET_IDS:
+            if preset_id in self.preset_preview_dirty:
+                self.preset_preview_queue[preset_id] = self.preset_preview_revisions[preset_id]
+        if self.current_preset in self.preset_preview_queue:
+            self.preset_preview_queue.move_to_end(self.current_preset, last=False)
         if not self.presets_preview_worker_timer.isActive():
             self.presets_preview_worker_timer.start(0)
 
@@ -1933,34 +2628,93 @@ class ARPlusWindow(QMainWindow):
         if not hasattr(self, "preset_preview_labels"):
             return
         if not self.preset_preview_queue:
-            self._refresh_presets_preview_borders()
+            if not self.preset_preview_jobs:
+                self._refresh_presets_preview_borders()
             return
-        preset_id = self.preset_preview_queue.pop(0)
+        # Cache hits are applied in place; misses are composed on the thread pool, with a
+        # few renders in flight at most so the strip never starves the preview.
+        while self.preset_preview_queue and len(self.preset_preview_jobs) < self.presets_preview_max_jobs:
+            preset_id, _queued_revision = self.preset_preview_queue.popitem(last=False)
+            label = self.preset_preview_labels.get(preset_id)
+            if label is None:
+                self.preset_preview_dirty.discard(preset_id)
+                continue
+            # A preset already rendering is re-queued once that render lands.
+            if preset_id not in self.preset_preview_dirty or preset_id in self.preset_preview_jobs:
+                continue
+            revision = self.preset_preview_revisions[preset_id]
+            cache_key = self._preset_thumbnail_cache_key(preset_id)
+            cached = self._cached_preset_thumbnail(cache_key)
+            if cached is not None:
+                self._apply_preset_thumbnail(preset_id, revision, cached)
+                continue
+            self.preset_preview_jobs.add(preset_id)
+            task = BackgroundRenderTask(
+                partial(self._render_preset_thumbnail_image, snapshot=self._preset_render_snapshot(preset_id)),
+                revision,
+                cache_key,
+                cache_key,
+            )
+            task.finished.connect(self._on_preset_thumbnail_rendered)
+            QThreadPool.globalInstance().start(task)
+        self._schedule_next_preset_preview()
+
+    def _on_preset_thumbnail_rendered(self, revision: int, cache_key: tuple, image: QImage | None, error: str):
+        preset_id = cache_key[0]
+        self.preset_preview_jobs.discard(preset_id)
+        if error:
+            self._log(f"Erreur miniature {preset_id}: {error}")
+        # Edited mid-render: assets and logo/textbox settings are read live on the worker, so
+        # the result may mix both states. Drop it; the preset is still dirty and renders again.
+        if revision == self.preset_preview_revisions[preset_id]:
+            self._apply_preset_thumbnail(preset_id, revision, self._store_preset_thumbnail(cache_key, image))
+        self._schedule_next_preset_preview()
+
+    def _schedule_next_preset_preview(self):
+        if self.preset_preview_queue:
+            if len(self.preset_preview_jobs) < self.presets_preview_max_jobs:
+                self.presets_preview_worker_timer.start(self.presets_preview_worker_interval_ms)
+        elif self.preset_preview_dirty.difference(self.preset_preview_jobs):
+            self.presets_preview_timer.start(self.presets_preview_interval_ms)
+        elif not self.preset_preview_jobs:
+            self._refresh_presets_preview_borders()
+
+    def _apply_preset_thumbnail(self, preset_id: str, revision: int, pixmap: QPixmap):
         label = self.preset_preview_labels.get(preset_id)
         if label is None:
-            self.preset_preview_dirty.discard(preset_id)
+            return
+        if pixmap.isNull():
+            label.setPixmap(QPixmap())
+            label.setText("N/A")
         else:
-            pixmap = self._build_preset_thumbnail_pixmap(preset_id)
-            if pixmap.isNull():
-                label.setPixmap(QPixmap())
-                label.setText("N/A")
-            else:
-                label.setText("")
-                label.setPixmap(pixmap)
+            label.setText("")
+            label.setPixmap(pixmap)
+        # Only clear the dirty flag if nothing touched the preset while it was rendered.
+        if self.preset_preview_revisions[preset_id] == revision:
             self.preset_preview_dirty.discard(preset_id)
-            border_color = "#D78EF1" if preset_id == self.current_preset else "#5E5E66"
-            label.setStyleSheet(
-                f"border: 2px solid {border_color}; background-color: #1F1F24;"
-            )
-        if self.preset_preview_queue:
-            self.presets_preview_worker_timer.start(self.presets_preview_worker_interval_ms)
+        self._apply_preset_preview_border(preset_id, label)
 
     def _preview_pixmap(self, layer_id: str, canvas_w: int, canvas_h: int) -> QPixmap:
         if layer_id == "gradient":
+            # The gradient only depends on its settings and the canvas size, so switching
+            # presets back and forth reuses the pixmap instead of rebuilding it.
+            cache_key = (
+                canvas_w,
+                canvas_h,
+                tuple(sorted(self._gradient_config(self.current_preset).items())),
+            )
+            cached = self.gradient_preview_cache.get(cache_key)
+            if cached is not None:
+                self.gradient_preview_cache.move_to_end(cache_key)
+                return cached
             gradient_img = self._build_gradient_image(canvas_w, canvas_h, self.current_preset)
             if gradient_img is None:
                 return QPixmap()
-            return self._pil_to_qpixmap(gradient_img)
+            pixmap = self._pil_to_qpixmap(gradient_img)
+            self.gradient_preview_cache[cache_key] = pixmap
+            while len(self.gradient_preview_cache) > GRADIENT_PREVIEW_CACHE_SIZE:
+                self.gradient_preview_cache.popitem(last=False)
+            return pixmap
 
         layer_state = self._layer_state(self.current_preset, layer_id)
         fit_mode = layer_state["fit_mode"]
@@ -1980,38 +2734,94 @@ class ARPlusWindow(QMainWindow):
         if src_w == 0 or src_h == 0:
             return QPixmap()
 
-        if fit_mode in {"cover", "crop"}:
-            ratio = max(canvas_w / src_w, canvas_h / src_h)
-        elif fit_mode == "contain":
-            ratio = min(canvas_w / src_w, canvas_h / src_h)
-        else:
-            ratio = 1.0
-
-        ratio *= scale
+        ratio = FIT_RATIO_FUNCS.get(fit_mode, _fit_ratio_native)(canvas_w, canvas_h, src_w, src_h) * scale
         target_w = max(1, int(src_w * ratio))
         target_h = max(1, int(src_h * ratio))
-        rendered = base.scaled(
-            target_w,
-            target_h,
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        if base is self.assets[layer_id].pixmap:
+            base = self._pick_mipmap_level(base, self.assets[layer_id].mipmaps, target_w, target_h)
+        rendered = self._scaled_layer_pixmap(layer_id, base, target_w, target_h)
         if layer_id == "logo":
             return self._apply_logo_shadow_preview(rendered)
         return rendered
 
+    def _scaled_layer_pixmap(self, layer_id: str, base: QPixmap, target_w: int, target_h: int) -> QPixmap:
+        if base.width() == target_w and base.height() == target_h:
+            return base
+        if self.preview_interacting:
+            mode = Qt.TransformationMode.FastTransformation
+        else:
+            mode = Qt.TransformationMode.SmoothTransformation
+        key = (layer_id, base.cacheKey(), target_w, target_h, mode)
+        cached = self.scaled_pixmap_cache.get(key)
+        if cached is not None:
+            self.scaled_pixmap_cache.move_to_end(key)
+            return cached
+        if mode == Qt.TransformationMode.SmoothTransformation and (
+            target_w * 2 < base.width() or target_h * 2 < base.height()
+        ):
+            # Qt's smooth scaling is a plain bilinear and aliases past a 2x reduction. Mipmaps
+            # keep assets under that, so this mostly serves the text logo once a drag ends.
+            resized = self._qpixmap_to_pil(base).resize((target_w, target_h), Image.Resampling.LANCZOS)
+            rendered = self._pil_to_qpixmap(resized)
+        else:
+            rendered = base.scaled(
+                target_w,
+                target_h,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                mode,
+            )
+        self.scaled_pixmap_cache[key] = rendered
+        while len(self.scaled_pixmap_cache) > SCALED_PIXMAP_CACHE_SIZE:
+            self.scaled_pixmap_cache.popitem(last=False)
+        return rendered
+
+    def _resized_layer_image(self, layer_id: str, source: Image.Image, target_size: Tuple[int, int], resample):
+        if source.size == target_size:
+            return source
+        key = (layer_id, id(source), target_size, resample)
+        with self.render_cache_lock:
+            cached = self.resized_image_cache.get(key)
+            # The cache keeps a reference to the source, so a matching id() is only trusted
+            # when it still points to the very same image object.
+            if cached is not None and cached[0] is source:
+                self.resized_image_cache.move_to_end(key)
+                return cached[1]
+        rendered = source.resize(target_size, resample, reducing_gap=RESIZE_REDUCING_GAP)
+        if target_size[0] * target_size[1] > RESIZED_IMAGE_CACHE_MAX_PIXELS:
+            return rendered
+        with self.render_cache_lock:
+            self.resized_image_cache[key] = (source, rendered)
+            while len(self.resized_image_cache) > RESIZED_IMAGE_CACHE_SIZE or (
+                sum(entry[1].width * entry[1].height for entry in self.resized_image_cache.values())
+                > RESIZED_IMAGE_CACHE_MAX_PIXELS
+            ):
+                self.resized_image_cache.popitem(last=False)
+        return rendered
+
+    def _invalidate_layer_render_cache(self, layer_id: str | None = None):
+        with self.render_cache_lock:
+            if layer_id is None:
+                self.scaled_pixmap_cache.clear()
+                self.resized_image_cache.clear()
+                return
+            for cache in (self.scaled_pixmap_cache, self.resized_image_cache):
+                for key in [key for key in cache if key[0] == layer_id]:
+                    del cache[key]
+
     def _select_export_dir(self):
         path = QFileDialog.getExistingDirectory(self, "Dossier d'export")
         if path:
             self.export_dir.setText(path)
 
     def _selected_exports(self):
-        selected = []
-        for i in range(self.export_list.count()):
-            item = self.export_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                selected.append(item.data(Qt.ItemDataRole.UserRole))
-        return selected
+        item_at = self.export_list.item
+        checked = Qt.CheckState.Checked
+        user_role = Qt.ItemDataRole.UserRole
+        return [
+            item.data(user_role)
+            for item in map(item_at, range(self.export_list.count()))
+            if item.checkState() == checked
+        ]
 
     def _to_float(self, value, default: float) -> float:
         try:
@@ -2028,14 +2838,7 @@ class ARPlusWindow(QMainWindow):
     def _update_position_info(self):
         if not hasattr(self, "position_labels"):
             return
-        labels = {
-            "background": "Background",
-            "character": "Perso",
-            "character2": "Perso 2",
-            "character3": "Perso 3",
-            "character4": "Perso 4",
-            "logo": "Logo",
-        }
+        label_texts = self.position_label_texts
         for layer_id, label_widget in self.position_labels.items():
             layer_state = self._layer_state(self.current_preset, layer_id)
             transform = layer_state.get("transform", {})
@@ -2045,14 +2848,18 @@ class ARPlusWindow(QMainWindow):
             suffix = "" if allowed else " (non actif sur ce preset)"
             if layer_id in EXTRA_CHARACTER_LAYERS and not self._layer_has_loaded_asset(layer_id):
                 suffix += " (non charge)"
-            label_widget.setText(f"{labels[layer_id]}: X={x}px  Y={y}px{suffix}")
+            text = f"{POSITION_LABEL_NAMES[layer_id]}: X={x}px  Y={y}px{suffix}"
+            # Most refreshes (opacity, colors, other layers) leave every label as it was.
+            if label_texts.get(layer_id) != text:
+                label_texts[layer_id] = text
+                label_widget.setText(text)
 
     def _merge_state_from_snapshot(self, raw_state):
         merged = self._build_default_state()
         if not isinstance(raw_state, dict):
             return merged
 
-        for preset_id in PRESETS:
+        for preset_id in PRESET_IDS:
             preset_data = raw_state.get(preset_id)
             if not isinstance(preset_data, dict):
                 continue
@@ -2093,11 +2900,12 @@ class ARPlusWindow(QMainWindow):
         if not isinstance(selected_exports, list):
             return
         selected_ids = {item for item in selected_exports if isinstance(item, str)}
-        for i in range(self.export_list.count()):
-            item = self.export_list.item(i)
-            preset_id = item.data(Qt.ItemDataRole.UserRole)
-            check_state = Qt.CheckState.Checked if preset_id in selected_ids else Qt.CheckState.Unchecked
-            item.setCheckState(check_state)
+        item_at = self.export_list.item
+        user_role = Qt.ItemDataRole.UserRole
+        checked = Qt.CheckState.Checked
+        unchecked = Qt.CheckState.Unchecked
+        for item in map(item_at, range(self.export_list.count())):
+            item.setCheckState(checked if item.data(user_role) in selected_ids else unchecked)
 
     def _apply_logo_text_settings(self, raw_logo_text):
         if not isinstance(raw_logo_text, dict):
@@ -2207,18 +3015,18 @@ class ARPlusWindow(QMainWindow):
 
         if not isinstance(raw_gradient, dict):
             self.gradient_settings = {
-                preset_id: self._default_gradient_config() for preset_id in PRESETS
+                preset_id: self._default_gradient_config() for preset_id in PRESET_IDS
             }
             self._sync_gradient_controls()
             return
 
         has_per_preset = any(
-            isinstance(raw_gradient.get(preset_id), dict) for preset_id in PRESETS
+            isinstance(raw_gradient.get(preset_id), dict) for preset_id in PRESET_IDS
         )
         if has_per_preset:
             self.gradient_settings = {
                 preset_id: _normalize_gradient_cfg(raw_gradient.get(preset_id))
-                for preset_id in PRESETS
+                for preset_id in PRESET_IDS
             }
             self._sync_gradient_controls()
             return
@@ -2226,7 +3034,7 @@ class ARPlusWindow(QMainWindow):
         # Backward compatibility: old snapshots had one global gradient block.
         shared_cfg = _normalize_gradient_cfg(raw_gradient)
         self.gradient_settings = {
-            preset_id: dict(shared_cfg) for preset_id in PRESETS
+            preset_id: dict(shared_cfg) for preset_id in PRESET_IDS
         }
         self._sync_gradient_controls()
 
@@ -2391,27 +3199,24 @@ class ARPlusWindow(QMainWindow):
                 return candidate
         return None
 
-    def _color_bbox(self, image_rgb: Image.Image, rgb: Tuple[int, int, int], tolerance: int):
-        color_layer = Image.new("RGB", image_rgb.size, rgb)
-        diff = ImageChops.difference(image_rgb, color_layer)
-        channel_r, channel_g, channel_b = diff.split()
-        mask_r = channel_r.point(lambda value: 255 if value <= tolerance else 0)
-        mask_g = channel_g.point(lambda value: 255 if value <= tolerance else 0)
-        mask_b = channel_b.point(lambda value: 255 if value <= tolerance else 0)
-        mask = ImageChops.multiply(mask_r, ImageChops.multiply(mask_g, mask_b))
-        bbox = mask.getbbox()
-        if bbox is None:
-            return None
-        x0, y0, x1, y1 = bbox
-        if x1 <= x0 or y1 <= y0:
-            return None
-        return bbox
+    def _color_bboxes(self, image_rgb: Image.Image, colors: Tuple[Tuple[int, int, int], ...], tolerance: int):
+        # A single pass over the RGB image packs every color's per-band matches into one
+        # "L" band; each color then only needs a lookup on that band to get its bbox.
+        band_lut, color_luts = _guide_match_luts(colors, tolerance)
+        matches = image_rgb.point(band_lut).convert("L", (1, 1, 1, 0))
+        bboxes = []
+        for color_lut in color_luts:
+            bbox = matches.point(color_lut).getbbox()
+            if bbox is not None and (bbox[2] <= bbox[0] or bbox[3] <= bbox[1]):
+                bbox = None
+            bboxes.append(bbox)
+        return bboxes
 
     def _extract_guide_regions(self, image_rgb: Image.Image):
         width, height = image_rgb.size
         regions: Dict[str, Tuple[float, float, float, float]] = {}
-        for layer_id, color in GUIDE_COLOR_MAP.items():
-            bbox = self._color_bbox(image_rgb, color, GUIDE_COLOR_TOLERANCE)
+        bboxes = self._color_bboxes(image_rgb, tuple(GUIDE_COLOR_MAP.values()), GUIDE_COLOR_TOLERANCE)
+        for layer_id, bbox in zip(GUIDE_COLOR_MAP, bboxes):
             if bbox is None:
                 continue
             x0, y0, x1, y1 = bbox
@@ -2420,27 +3225,94 @@ class ARPlusWindow(QMainWindow):
             regions["background"] = (0.0, 0.0, float(width), float(height))
         return regions
 
-    def _load_guides(self):
-        self.guide_pixmaps = {}
+    def _decode_guide_image(self, guide_path: Path, canvas_w: int, canvas_h: int):
+        guide_rgb = Image.open(guide_path).convert("RGB")
+        if guide_rgb.size != (canvas_w, canvas_h):
+            guide_rgb = guide_rgb.resize((canvas_w, canvas_h), Image.Resampling.LANCZOS)
+        return self._pil_to_qimage(guide_rgb), self._extract_guide_regions(guide_rgb)
+
+    def _pending_guide_loads(self):
+        # Yields (preset_id, guide_path, canvas size, cache key) for guides not decoded yet,
+        # after filling guide_images/guide_regions from the decode cache.
+        self.guide_load_generation += 1
+        self.guide_loads_pending = set()
+        self.guide_images = {}
         self.guide_regions = {}
-        for preset_id, meta in PRESETS.items():
+        for preset_id in PRESET_IDS:
             if preset_id == "logo":
                 continue
             guide_path = self._guide_path_for_preset(preset_id)
             if guide_path is None:
                 continue
+            canvas_w, canvas_h = PRESET_SIZES[preset_id]
+            # Guide files never change while the app runs; variant switches, project loads
+            # and new projects reuse the decoded pixmap and extracted regions.
+            cache_key = (str(guide_path), canvas_w, canvas_h)
+            cached = self.guide_decode_cache.get(cache_key)
+            if cached is not None:
+                self.guide_images[preset_id], self.guide_regions[preset_id] = cached
+                continue
+            yield preset_id, guide_path, canvas_w, canvas_h, cache_key
+
+    def _load_guides(self):
+        for preset_id, guide_path, canvas_w, canvas_h, cache_key in self._pending_guide_loads():
             try:
-                canvas_w, canvas_h = meta["size"]
-                guide_rgb = Image.open(guide_path).convert("RGB")
-                if guide_rgb.size != (canvas_w, canvas_h):
-                    guide_rgb = guide_rgb.resize((canvas_w, canvas_h), Image.Resampling.LANCZOS)
-                self.guide_regions[preset_id] = self._extract_guide_regions(guide_rgb)
-                self.guide_pixmaps[preset_id] = self._pil_to_qpixmap(guide_rgb.convert("RGBA"))
+                image, regions = self._decode_guide_image(guide_path, canvas_w, canvas_h)
             except Exception as exc:
                 self._log(f"Avertissement: gabarit non charge ({guide_path.name}): {exc}")
-        self._refresh_guide_overlay(*PRESETS[self.current_preset]["size"])
+                continue
+            self._store_decoded_guide(preset_id, cache_key, image, regions)
+        self._refresh_guide_overlay(*PRESET_SIZES[self.current_preset])
+
+    def _load_guides_async(self):
+        # Startup path: JPEG decode and region extraction run on the thread pool so the
+        # window paints first. Anything that needs regions before they land loads them in place.
+        generation = self.guide_load_generation + 1
+        for preset_id, guide_path, canvas_w, canvas_h, cache_key in self._pending_guide_loads():
+            self.guide_loads_pending.add(preset_id)
+            task = BackgroundRenderTask(
+                partial(self._decode_guide_image, canvas_w=canvas_w, canvas_h=canvas_h),
+                generation,
+                (preset_id, cache_key),
+                guide_path,
+            )
+            task.finished.connect(self._on_guide_decoded)
+            QThreadPool.globalInstance().start(task)
+        self._refresh_guide_overlay(*PRESET_SIZES[self.current_preset])
+
+    def _on_guide_decoded(self, generation: int, key: tuple, result: tuple | None, error: str):
+        if generation != self.guide_load_generation:
+            return
+        preset_id, cache_key = key
+        self.guide_loads_pending.discard(preset_id)
+        if result is None:
+            self._log(f"Avertissement: gabarit non charge ({Path(cache_key[0]).name}): {error}")
+            return
+        image, regions = result
+        self._store_decoded_guide(preset_id, cache_key, image, regions)
+        if preset_id == self.current_preset:
+            self._refresh_guide_overlay(*PRESET_SIZES[preset_id])
+
+    def _store_decoded_guide(self, preset_id: str, cache_key: tuple, image: QImage, regions):
+        self.guide_decode_cache[cache_key] = (image, regions)
+        self.guide_images[preset_id] = image
+        self.guide_regions[preset_id] = regions
+
+    def _guide_pixmap(self, preset_id: str) -> QPixmap | None:
+        # Guides are kept decoded as QImage; the pixmap is only built for presets actually
+        # shown, once per decoded guide.
+        image = self.guide_images.get(preset_id)
+        if image is None:
+            return None
+        pixmap = self.guide_pixmap_cache.get(image.cacheKey())
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(image)
+            self.guide_pixmap_cache[image.cacheKey()] = pixmap
+        return pixmap
 
     def _guide_region_for_layer(self, preset_id: str, layer_id: str):
+        if preset_id in self.guide_loads_pending:
+            self._load_guides()
         regions = self.guide_regions.get(preset_id, {})
         key = "character" if layer_id in CHARACTER_LAYERS else layer_id
         return regions.get(key)
@@ -2451,7 +3323,7 @@ class ARPlusWindow(QMainWindow):
         if not self.guides_visible or self.current_preset == "logo":
             self.guide_item.setVisible(False)
             return
-        guide_pixmap = self.guide_pixmaps.get(self.current_preset)
+        guide_pixmap = self._guide_pixmap(self.current_preset)
         if guide_pixmap is None or guide_pixmap.isNull():
             self.guide_item.setVisible(False)
             return
@@ -2484,13 +3356,8 @@ class ARPlusWindow(QMainWindow):
             return False
         src_w = max(1, layer_pixmap.width())
         src_h = max(1, layer_pixmap.height())
-        alpha_bbox = None
-        source_pil = self.assets[layer_id].pil
-        if source_pil is not None:
-            try:
-                alpha_bbox = source_pil.getchannel("A").getbbox()
-            except Exception:
-                alpha_bbox = None
+        # Computed once at import; this runs for every preset of an imported layer.
+        alpha_bbox = self.assets[layer_id].alpha_bbox
         if alpha_bbox is None:
             alpha_bbox = (0, 0, src_w, src_h)
         alpha_x0, alpha_y0, alpha_x1, alpha_y1 = alpha_bbox
@@ -2499,30 +3366,31 @@ class ARPlusWindow(QMainWindow):
         alpha_cx = (float(alpha_x0) + float(alpha_x1)) * 0.5
         alpha_cy = (float(alpha_y0) + float(alpha_y1)) * 0.5
 
-        canvas_w, canvas_h = PRESETS[preset_id]["size"]
+        canvas_w, canvas_h = PRESET_SIZES[preset_id]
         base_ratio = min(canvas_w / src_w, canvas_h / src_h)
         if base_ratio <= 0:
             return False
         layer_state = self._layer_state(preset_id, layer_id)
         layer_state["fit_mode"] = "contain"
+        transform = layer_state["transform"]
         target_center_x = box_x + (box_w * 0.5)
         if layer_id in CHARACTER_LAYERS:
             # Keep character top at yellow-circle top and force bottom to touch canvas bottom.
             target_height = max(1.0, canvas_h - box_y)
             target_ratio = max(0.01, target_height / alpha_h)
             target_scale = max(0.01, target_ratio / base_ratio)
-            layer_state["transform"]["anchor"] = "bottom"
-            layer_state["transform"]["scale"] = target_scale
-            layer_state["transform"]["x"] = target_center_x - ((alpha_cx - (src_w * 0.5)) * target_ratio)
-            layer_state["transform"]["y"] = box_y + ((src_h - alpha_y0) * target_ratio)
+            transform["anchor"] = "bottom"
+            transform["scale"] = target_scale
+            transform["x"] = target_center_x - ((alpha_cx - (src_w * 0.5)) * target_ratio)
+            transform["y"] = box_y + ((src_h - alpha_y0) * target_ratio)
         else:
             target_ratio = max(0.01, min(box_w / alpha_w, box_h / alpha_h))
             target_scale = max(0.01, target_ratio / base_ratio)
-            layer_state["transform"]["anchor"] = "center"
-            layer_state["transform"]["scale"] = target_scale
+            transform["anchor"] = "center"
+            transform["scale"] = target_scale
             target_center_y = box_y + (box_h * 0.5)
-            layer_state["transform"]["x"] = target_center_x - ((alpha_cx - (src_w * 0.5)) * target_ratio)
-            layer_state["transform"]["y"] = target_center_y - (
+            transform["x"] = target_center_x - ((alpha_cx - (src_w * 0.5)) * target_ratio)
+            transform["y"] = target_center_y - (
                 (alpha_cy - (src_h * 0.5)) * target_ratio
             )
         return True
@@ -2534,16 +3402,15 @@ class ARPlusWindow(QMainWindow):
         snapshot_program_root: Path | None,
     ):
         source_path = Path(raw_path).expanduser()
-        candidates = []
+        # Candidates are only built and checked until the first one that exists.
+        if source_path.exists():
+            return source_path
         if source_path.is_absolute():
-            candidates.append(source_path)
-        else:
-            candidates.append(source_path)
-            candidates.append(snapshot_file.parent / source_path)
-            if snapshot_program_root is not None:
-                candidates.append(snapshot_program_root / source_path)
-
-        for candidate in candidates:
+            return None
+        for base_dir in (snapshot_file.parent, snapshot_program_root):
+            if base_dir is None:
+                continue
+            candidate = base_dir / source_path
             if candidate.exists():
                 return candidate
         return None
@@ -2554,27 +3421,80 @@ class ARPlusWindow(QMainWindow):
         except Exception as exc:
             return False, f"lecture PIL impossible ({exc})"
 
-        pixmap = QPixmap(str(file_path))
+        # Reuse Pillow's decode for the preview pixmap instead of decoding the file again in Qt.
+        pixmap = self._pil_to_qpixmap(pil_img)
         if pixmap.isNull():
             return False, "pixmap invalide"
 
-        self.assets[layer_id] = LayerAsset(path=str(file_path), pixmap=pixmap, pil=pil_img)
+        self.assets[layer_id] = self._build_layer_asset(str(file_path), pixmap, pil_img)
+        self._invalidate_layer_render_cache(layer_id)
         return True, ""
 
+    def _build_layer_asset(self, path: str, pixmap: QPixmap, pil_img: Image.Image) -> LayerAsset:
+        # Half-size levels down to MIPMAP_MIN_SIZE, so renders never scale from a much larger source.
+        mipmaps = []
+        level = pixmap
+        while min(level.width(), level.height()) // 2 >= MIPMAP_MIN_SIZE:
+            level = level.scaled(
+                level.width() // 2,
+                level.height() // 2,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            mipmaps.append(level)
+        pil_mipmaps = []
+        pil_level = pil_img
+        while min(pil_level.size) // 2 >= MIPMAP_MIN_SIZE:
+            pil_level = pil_level.reduce(2)
+            pil_mipmaps.append(pil_level)
+        try:
+            alpha_bbox = pil_img.getchannel("A").getbbox()
+        except Exception:
+            alpha_bbox = None
+        return LayerAsset(
+            path=path,
+            pixmap=pixmap,
+            pil=pil_img,
+            mipmaps=mipmaps,
+            pil_mipmaps=pil_mipmaps,
+            alpha_bbox=alpha_bbox,
+        )
+
+    def _pick_mipmap_level(self, base, levels: list, target_w: int, target_h: int):
+        picked = base
+        for level in levels:
+            level_w, level_h = (level.width(), level.height()) if isinstance(level, QPixmap) else level.size
+            if level_w < target_w or level_h < target_h:
+                break
+            picked = level
+        return picked
+
     def _load_project_snapshot(self):
         default_dir = self.autosave_dir if self.autosave_dir.exists() else self.program_root
-        file_path, _ = QFileDialog.getOpenFileName(
+        dialog = QFileDialog(
             self,
             "Charger une sauvegarde projet",
             str(default_dir),
             "ARPlus Save (*.arplus.json *.json);;JSON (*.json)",
         )
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        self._open_file_dialog(dialog, self._load_project_snapshot_file)
+
+    def _open_file_dialog(self, dialog: QFileDialog, on_selected):
+        # open() keeps the picker window-modal without spinning a nested event loop; the
+        # chosen path comes back through fileSelected.
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
+
+    def _load_project_snapshot_file(self, file_path: str):
         if not file_path:
             return
 
         snapshot_file = Path(file_path).expanduser()
         try:
-            payload = json.loads(snapshot_file.read_text(encoding="utf-8"))
+            payload = json.loads(snapshot_file.read_bytes())
         except Exception as exc:
             self._log(f"Erreur lecture sauvegarde: {exc}")
             QMessageBox.critical(self, "Erreur", f"Impossible de lire la sauvegarde: {exc}")
@@ -2589,66 +3509,72 @@ class ARPlusWindow(QMainWindow):
         if isinstance(raw_program_root, str) and raw_program_root.strip():
             snapshot_program_root = Path(raw_program_root).expanduser()
 
-        self.state = self._merge_state_from_snapshot(payload.get("state"))
-        self._apply_logo_text_settings(payload.get("logo_text"))
-        self._apply_poster_textbox_settings(payload.get("poster_textbox"))
-        self._apply_logo_shadow_settings(payload.get("logo_shadow"))
-        self._apply_gradient_settings(payload.get("gradient"))
-        self._apply_guide_settings(payload.get("guides"))
-        self._apply_selected_exports(payload.get("selected_exports"))
-
-        base_name = payload.get("base_name")
-        if isinstance(base_name, str):
-            self.base_name_input.setText(base_name)
-
-        current_preset = payload.get("current_preset")
-        if isinstance(current_preset, str) and current_preset in PRESETS:
-            self.current_preset = current_preset
-
-        for layer_id in LAYER_ORDER:
-            self.assets[layer_id] = LayerAsset()
+        # Dozens of widgets and scene items change below; hold repaints until all of it is done.
+        self.setUpdatesEnabled(False)
+        try:
+            self.state = self._merge_state_from_snapshot(payload.get("state"))
+            self._apply_logo_text_settings(payload.get("logo_text"))
+            self._apply_poster_textbox_settings(payload.get("poster_textbox"))
+            self._apply_logo_shadow_settings(payload.get("logo_shadow"))
+            self._apply_gradient_settings(payload.get("gradient"))
+            self._apply_guide_settings(payload.get("guides"))
+            self._apply_selected_exports(payload.get("selected_exports"))
+
+            base_name = payload.get("base_name")
+            if isinstance(base_name, str):
+                self.base_name_input.setText(base_name)
+
+            current_preset = payload.get("current_preset")
+            if isinstance(current_preset, str) and current_preset in PRESETS:
+                self.current_preset = current_preset
 
-        missing_assets = []
-        load_errors = []
-        assets_data = payload.get("assets")
-        if isinstance(assets_data, dict):
             for layer_id in LAYER_ORDER:
-                layer_entry = assets_data.get(layer_id)
-                if not isinstance(layer_entry, dict):
-                    continue
-                raw_path = layer_entry.get("path")
-                if not isinstance(raw_path, str) or not raw_path.strip():
-                    continue
-                raw_path = raw_path.strip()
-                resolved_path = self._resolve_snapshot_asset_path(
-                    raw_path,
-                    snapshot_file,
-                    snapshot_program_root,
-                )
-                if resolved_path is None:
-                    self.assets[layer_id] = LayerAsset(path=raw_path)
-                    missing_assets.append((layer_id, raw_path))
-                    continue
-
-                ok, error = self._load_layer_asset_from_file(layer_id, resolved_path)
-                if not ok:
-                    self.assets[layer_id] = LayerAsset(path=raw_path)
-                    load_errors.append((layer_id, raw_path, error))
-
-        preset_index = self.preset_combo.findData(self.current_preset)
-        if preset_index >= 0:
-            self.preset_combo.blockSignals(True)
-            self.preset_combo.setCurrentIndex(preset_index)
-            self.preset_combo.blockSignals(False)
-        self._refresh_presets_preview_borders()
+                self.assets[layer_id] = LayerAsset()
+            self._invalidate_layer_render_cache()
+
+            missing_assets = []
+            load_errors = []
+            assets_data = payload.get("assets")
+            if isinstance(assets_data, dict):
+                for layer_id in LAYER_ORDER:
+                    layer_entry = assets_data.get(layer_id)
+                    if not isinstance(layer_entry, dict):
+                        continue
+                    raw_path = layer_entry.get("path")
+                    if not isinstance(raw_path, str) or not raw_path.strip():
+                        continue
+                    raw_path = raw_path.strip()
+                    resolved_path = self._resolve_snapshot_asset_path(
+                        raw_path,
+                        snapshot_file,
+                        snapshot_program_root,
+                    )
+                    if resolved_path is None:
+                        self.assets[layer_id] = LayerAsset(path=raw_path)
+                        missing_assets.append((layer_id, raw_path))
+                        continue
+
+                    ok, error = self._load_layer_asset_from_file(layer_id, resolved_path)
+                    if not ok:
+                        self.assets[layer_id] = LayerAsset(path=raw_path)
+                        load_errors.append((layer_id, raw_path, error))
+
+            preset_index = self.preset_combo.findData(self.current_preset)
+            if preset_index >= 0:
+                self.preset_combo.blockSignals(True)
+                self.preset_combo.setCurrentIndex(preset_index)
+                self.preset_combo.blockSignals(False)
+            self._refresh_presets_preview_borders()
 
-        self._invalidate_presets_preview()
-        self._set_scene_for_preset(self.current_preset)
-        self._refresh_preview()
-        self._sync_layer_controls()
-        self._sync_poster_textbox_controls()
-        self._sync_gradient_controls()
-        self._update_position_info()
+            self._invalidate_presets_preview()
+            self._set_scene_for_preset(self.current_preset)
+            self._refresh_preview()
+            self._sync_layer_controls()
+            self._sync_poster_textbox_controls()
+            self._sync_gradient_controls()
+            self._update_position_info()
+        finally:
+            self.setUpdatesEnabled(True)
         self._log(f"Sauvegarde chargee: {snapshot_file}")
 
         if missing_assets:
@@ -2723,41 +3649,64 @@ class ARPlusWindow(QMainWindow):
             },
             "gradient": {
                 preset_id: dict(self._gradient_config(preset_id))
-                for preset_id in PRESETS
+                for preset_id in PRESET_IDS
             },
             "guides": {
                 "visible": self.guides_visible,
                 "opacity": self.guides_opacity,
                 "poster_variant": self.poster_guide_variant,
             },
-            "state": copy.deepcopy(self.state),
+            # Serialized right away by _project_snapshot_text, so no copy is needed.
+            "state": self.state,
         }
 
-    def _write_project_snapshot(self, save_path: Path) -> Path:
-        payload = self._project_snapshot_payload()
+    def _project_snapshot_text(self, payload: dict | None = None) -> str:
+        if payload is None:
+            payload = self._project_snapshot_payload()
+        return json.dumps(payload, indent=2, ensure_ascii=False)
+
+    def _write_project_snapshot(self, save_path: Path, text: str | None = None) -> Path:
+        if text is None:
+            text = self._project_snapshot_text()
         out_path = save_path.expanduser()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        out_path.write_text(text, encoding="utf-8")
         return out_path
 
     def _autosave_project_snapshot(self, base_name: str) -> Path:
+        # Repeated exports of an unchanged project keep pointing at the last autosave
+        # instead of writing an identical file each time (only the timestamp would differ).
+        payload = self._project_snapshot_payload()
+        text = self._project_snapshot_text(payload)
+        # The digest covers the text that gets written, minus the timestamp, which is the
+        # first occurrence of its value (only schema_version comes before it).
+        digest = hashlib.blake2b(
+            text.replace(payload["saved_at"], "", 1).encode("utf-8"),
+            digest_size=16,
+        ).digest()
+        last = self.last_autosave
+        if last is not None and last[0] == (base_name, digest) and last[1].exists():
+            return last[1]
         self.autosave_dir.mkdir(parents=True, exist_ok=True)
-        return self._write_project_snapshot(self.autosave_dir / self._snapshot_file_name(base_name))
+        saved_path = self._write_project_snapshot(self.autosave_dir / self._snapshot_file_name(base_name), text)
+        self.last_autosave = ((base_name, digest), saved_path)
+        return saved_path
 
     def _save_project_snapshot_as(self):
         default_dir = Path(self.export_dir.text()).expanduser()
         if not default_dir.exists():
             default_dir = self.program_root
-        suggested = default_dir / self._snapshot_file_name()
-        file_path, _ = QFileDialog.getSaveFileName(
+        dialog = QFileDialog(
             self,
             "Sauvegarder l'etat projet",
-            str(suggested),
+            str(default_dir),
             "ARPlus Save (*.arplus.json);;JSON (*.json)",
         )
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.selectFile(self._snapshot_file_name())
+        self._open_file_dialog(dialog, self._save_project_snapshot_file)
+
+    def _save_project_snapshot_file(self, file_path: str):
         if not file_path:
             return
         out_path = Path(file_path).expanduser()
@@ -2773,8 +3722,8 @@ class ARPlusWindow(QMainWindow):
 
     def _set_all_exports_checked(self, checked: bool):
         state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        for i in range(self.export_list.count()):
-            self.export_list.item(i).setCheckState(state)
+        for item in map(self.export_list.item, range(self.export_list.count())):
+            item.setCheckState(state)
 
     def _new_project(self):
         answer = QMessageBox.question(
@@ -2794,53 +3743,59 @@ class ARPlusWindow(QMainWindow):
         except Exception as exc:
             self._log(f"Erreur autosafe avant nouveau projet: {exc}")
 
-        self.assets = {layer: LayerAsset() for layer in LAYER_ORDER}
-        self.state = self._build_default_state()
-        self.current_preset = "poster"
-        self.active_layer = "background"
-
-        self.logo_text_enabled = False
-        self.logo_text = ""
-        self.logo_text_size = 300
-        self.logo_text_align = "center"
-        self.logo_text_force_upper = True
-        self.logo_text_line_spacing = 100
-        self.logo_text_color = "#FFFFFF"
-        self.poster_textbox_enabled = True
-        self.poster_textbox_text = "TEXTE BOX"
-        self.logo_shadow_enabled = False
-        self.logo_shadow_distance = 5
-        self.logo_shadow_blur = 5
-        self.logo_shadow_angle = 135
-        self.logo_shadow_opacity = 60
-        self.logo_shadow_color = "#000000"
-        self.gradient_settings = {
-            preset_id: self._default_gradient_config() for preset_id in PRESETS
-        }
-        self.guides_visible = True
-        self.guides_opacity = GUIDE_OPACITY_DEFAULT
-        self.poster_guide_variant = "1"
+        # Same batch of widget and scene resets as a project load: repaint once at the end.
+        self.setUpdatesEnabled(False)
+        try:
+            self.assets = {layer: LayerAsset() for layer in LAYER_ORDER}
+            self._invalidate_layer_render_cache()
+            self.state = self._build_default_state()
+            self.current_preset = "poster"
+            self.active_layer = "background"
+
+            self.logo_text_enabled = False
+            self.logo_text = ""
+            self.logo_text_size = 300
+            self.logo_text_align = "center"
+            self.logo_text_force_upper = True
+            self.logo_text_line_spacing = 100
+            self.logo_text_color = "#FFFFFF"
+            self.poster_textbox_enabled = True
+            self.poster_textbox_text = "TEXTE BOX"
+            self.logo_shadow_enabled = False
+            self.logo_shadow_distance = 5
+            self.logo_shadow_blur = 5
+            self.logo_shadow_angle = 135
+            self.logo_shadow_opacity = 60
+            self.logo_shadow_color = "#000000"
+            self.gradient_settings = {
+                preset_id: self._default_gradient_config() for preset_id in PRESET_IDS
+            }
+            self.guides_visible = True
+            self.guides_opacity = GUIDE_OPACITY_DEFAULT
+            self.poster_guide_variant = "1"
 
-        self.base_name_input.setText("Name")
-        self._set_all_exports_checked(True)
-        self._sync_logo_controls()
-        self._sync_gradient_controls()
-        self._load_guides()
+            self.base_name_input.setText("Name")
+            self._set_all_exports_checked(True)
+            self._sync_logo_controls()
+            self._sync_gradient_controls()
+            self._load_guides()
 
-        preset_index = self.preset_combo.findData(self.current_preset)
-        if preset_index >= 0:
-            self.preset_combo.blockSignals(True)
-            self.preset_combo.setCurrentIndex(preset_index)
-            self.preset_combo.blockSignals(False)
-        self._refresh_presets_preview_borders()
+            preset_index = self.preset_combo.findData(self.current_preset)
+            if preset_index >= 0:
+                self.preset_combo.blockSignals(True)
+                self.preset_combo.setCurrentIndex(preset_index)
+                self.preset_combo.blockSignals(False)
+            self._refresh_presets_preview_borders()
 
-        self._set_active_layer("background", sync=False)
-        self._invalidate_presets_preview()
-        self._set_scene_for_preset(self.current_preset)
-        self._refresh_preview()
-        self._sync_layer_controls()
-        self._sync_poster_textbox_controls()
-        self._update_position_info()
+            self._set_active_layer("background", sync=False)
+            self._invalidate_presets_preview()
+            self._set_scene_for_preset(self.current_preset)
+            self._refresh_preview()
+            self._sync_layer_controls()
+            self._sync_poster_textbox_controls()
+            self._update_position_info()
+        finally:
+            self.setUpdatesEnabled(True)
         self._log("Nouveau projet initialise (visuels supprimes).")
 
     def _alpha_has_transparent_edge(self, alpha_channel: Image.Image) -> bool:
@@ -2912,16 +3867,27 @@ class ARPlusWindow(QMainWindow):
         except Exception as exc:
             self._log(f"Erreur autosafe projet: {exc}")
 
-        for idx, preset_id in enumerate(selected, start=1):
+        # Each canvas is encoded and written on export_pool while the next preset composes;
+        # results are then collected in order so the log and progress stay sequential.
+        jobs = []
+        for preset_id in selected:
             try:
-                self._export_preset(preset_id, export_dir, base_name)
+                jobs.append((preset_id, self._export_preset(preset_id, export_dir, base_name)))
             except Exception as exc:
-                self._log(f"Erreur export {preset_id}: {exc}")
+                jobs.append((preset_id, exc))
+        for idx, (preset_id, job) in enumerate(jobs, start=1):
+            if isinstance(job, Exception):
+                self._log(f"Erreur export {preset_id}: {job}")
+            else:
+                try:
+                    self._log(f"Export {PRESETS[preset_id]['label']}: {job.result()}")
+                except Exception as exc:
+                    self._log(f"Erreur export {preset_id}: {exc}")
             self.progress.setValue(int((idx / total) * 100))
 
         self._log("Export terminé.")
 
-    def _export_preset(self, preset_id: str, export_dir: Path, base_name: str):
+    def _export_preset(self, preset_id: str, export_dir: Path, base_name: str) -> Future:
         preset = PRESETS[preset_id]
         canvas = self._compose_preset_canvas(preset_id, log_upscale=True)
 
@@ -2929,12 +3895,15 @@ class ARPlusWindow(QMainWindow):
         ext = "png" if preset.get("png") else "jpg"
         file_name = f"{file_stub}-{base_name}.{ext}"
         out_path = export_dir / file_name
+        return self.export_pool.submit(self._write_export_canvas, canvas, out_path, ext)
 
+    def _write_export_canvas(self, canvas: Image.Image, out_path: Path, ext: str) -> Path:
+        # JPEG/PNG encoders release the GIL, so several presets can be written at once.
         if ext == "jpg":
             canvas.convert("RGB").save(out_path, quality=95)
         else:
             canvas.save(out_path)
-        self._log(f"Export {preset['label']}: {out_path}")
+        return out_path
 
     def _render_layer_for_export(
         self,
@@ -2943,14 +3912,15 @@ class ARPlusWindow(QMainWindow):
         canvas_w: int | None = None,
         canvas_h: int | None = None,
         resample=Image.Resampling.LANCZOS,
+        state: dict | None = None,
     ):
         if canvas_w is None or canvas_h is None:
-            preset_meta = PRESETS[preset_id]
-            canvas_w, canvas_h = preset_meta["size"]
+            canvas_w, canvas_h = PRESET_SIZES[preset_id]
         if layer_id == "gradient":
             return self._build_gradient_image(canvas_w, canvas_h, preset_id)
 
-        state = self._layer_state(preset_id, layer_id)
+        if state is None:
+            state = self._layer_state(preset_id, layer_id)
         fit_mode = state["fit_mode"]
         scale = state["transform"]["scale"]
 
@@ -2967,36 +3937,35 @@ class ARPlusWindow(QMainWindow):
         if sw == 0 or sh == 0:
             return None
 
-        if fit_mode in {"cover", "crop"}:
-            ratio = max(canvas_w / sw, canvas_h / sh)
-        elif fit_mode == "contain":
-            ratio = min(canvas_w / sw, canvas_h / sh)
-        else:
-            ratio = 1.0
-        ratio *= scale
+        ratio = FIT_RATIO_FUNCS.get(fit_mode, _fit_ratio_native)(canvas_w, canvas_h, sw, sh) * scale
 
         target_size = (max(1, int(sw * ratio)), max(1, int(sh * ratio)))
-        rendered = source.resize(target_size, resample)
+        if resample == Image.Resampling.LANCZOS:
+            low, high = EXPORT_BILINEAR_RATIO_RANGE
+            if low <= ratio <= high:
+                resample = Image.Resampling.BILINEAR
+        elif source is self.assets[layer_id].pil:
+            # Final exports always resample from the full-resolution source; the reduced
+            # levels only serve the fast thumbnail path.
+            source = self._pick_mipmap_level(source, self.assets[layer_id].pil_mipmaps, *target_size)
+        if resample != Image.Resampling.LANCZOS and target_size[0] * 2 < source.width:
+            # Past a 2x reduction (e.g. the text logo, which has no mipmaps) a box filter is
+            # cheaper than the thumbnail's bicubic kernel and looks the same at strip size.
+            resample = Image.Resampling.BOX
+        rendered = self._resized_layer_image(layer_id, source, target_size, resample)
         if layer_id == "logo":
             return self._apply_logo_shadow_pil(rendered)
         return rendered
 
     def _load_logo_font(self, size: int | None = None):
         font_size = size if size is not None else self.logo_text_size
-        font_candidates = [
-            "Montserrat-Bold.ttf",
-            "/usr/share/fonts/truetype/montserrat/Montserrat-Bold.ttf",
-            "/Library/Fonts/Montserrat-Bold.ttf",
-            "C:/Windows/Fonts/montserrat-bold.ttf",
-        ]
-        for candidate in font_candidates:
-            try:
-                return ImageFont.truetype(candidate, font_size)
-            except OSError:
-                continue
-        self._log("Avertissement: Montserrat Bold introuvable, police de secours utilisée.")
-        return ImageFont.load_default()
-
+        font = _load_montserrat(font_size)
+        if font is not None:
+            return font
+        if not self.logo_font_fallback_logged:
+            self.logo_font_fallback_logged = True
+            self._log("Avertissement: Montserrat Bold introuvable, police de secours utilisée.")
+        return _load_default_font()
 
     def _sanitize_base_name(self, raw_name: str) -> str:
         name = (raw_name or "").strip()